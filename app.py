@@ -3,11 +3,14 @@ import pandas as pd
 import plotly.graph_objects as go
 from pathlib import Path
 import os
-import base64
-import mimetypes
+
+# Çok süreçli kurulum: yükleyici süreç skor matrisini yayınlar
+# (python -m src.paylasimli_skor_matrisi); panel süreçleri bu yoldan bağlanır.
+PAYLASIM_YOLU = os.environ.get("YETKINLIK_PAYLASIM_YOLU")
 
 # --- BACKEND MODÜL ENTEGRASYONU ---
 # Not: src/yetkinlik_skor_hesaplayici.py dosyası güncellenmiş (birleştirilmiş) haliyle olmalıdır.
+# Analiz modülleri (küp, mentor eşleştirme) önbellekli kurulum fonksiyonlarında yüklenir.
 from src.yetkinlik_skor_hesaplayici import YetkinlikSkorHesaplayici
 from src.tavsiye_motoru import TavsiyeMotoru
 from src.etkinlik_kaziyici import EtkinlikKaziyici
@@ -101,45 +104,80 @@ def sistemi_baslat():
     etkinlik_yolu = kok_dizin / "data" / "input" / "etkinlik_listesi.csv"
     
     # Yeni birleştirilmiş backend yapısı başlatılıyor
-    hesaplayici = YetkinlikSkorHesaplayici(str(veri_yolu))
+    if PAYLASIM_YOLU:
+        # Ham tablo yüklenmez; skorlar paylaşımlı matristen salt-okunur okunur
+        from src.paylasimli_skor_matrisi import PaylasimliSkorMatrisi
+        hesaplayici = YetkinlikSkorHesaplayici(None, paylasimli_matris=PaylasimliSkorMatrisi(PAYLASIM_YOLU))
+    else:
+        hesaplayici = YetkinlikSkorHesaplayici(str(veri_yolu))
     tavsiye_motoru = TavsiyeMotoru(str(json_yolu))
     etkinlik_kaziyici = EtkinlikKaziyici(str(etkinlik_yolu))
     
     return hesaplayici, tavsiye_motoru, etkinlik_kaziyici, kok_dizin
 
+@st.cache_resource
+def kupu_olustur(_hesaplayici):
+    # Toplam/adet küpü bir kez kurulur; panel sorguları ham tabloya dönmez
+    from src.agrege_kup import AgregeKup
+    return AgregeKup(_hesaplayici)
+
+@st.cache_resource
+def mentor_eslestirici_olustur(_kup):
+    from src.mentor_eslestirici import MentorEslestirici
+    return MentorEslestirici(_kup)
+
+@st.cache_resource
+def organizasyon_agaci_olustur(_kup):
+    # Tüm alt ağaç rollup'ları bir kez hesaplanır; ekip görünümü sadece okur
+    from src.organizasyon_agaci import OrganizasyonAgaci
+    return OrganizasyonAgaci(_kup)
+
 try:
     hesaplayici, tavsiye_motoru, etkinlik_kaziyici, kok_dizin = sistemi_baslat()
 except Exception as e:
     st.error(f"Sistem başlatılamadı: {e}")
     st.stop()
 
+if hesaplayici.paylasimli_matris is not None:
+    hesaplayici.paylasimli_matris.yenile()
+
 # --- 3. YAN PANEL (KULLANICI SEÇİMİ) ---
 st.sidebar.image("https://upload.wikimedia.org/wikipedia/commons/8/86/TUSA%C5%9E_logo.png", width=200)
 st.sidebar.markdown("---")
 st.sidebar.markdown("### ⚙️ Parametreler")
 
-if hesaplayici.df.empty:
+calisan_listesi = hesaplayici.calisan_listesi()
+if not calisan_listesi:
     st.error("Veri bulunamadı.")
     st.stop()
 
-calisan_listesi = sorted(hesaplayici.df["employee_name"].unique())
-secilen_kisi = st.sidebar.selectbox("Çalışan Seçimi", calisan_listesi)
+# Küp tabanlı analizler ham değerlendirme satırlarını gerektirir (paylaşımlı modda kapalı).
+# Boş veri kontrolünden sonra kurulur; eksik kolonlu yedek tablo küpe ulaşmaz.
+if hesaplayici.paylasimli_matris is None:
+    kup = kupu_olustur(hesaplayici)
+    mentor_eslestirici = mentor_eslestirici_olustur(kup)
+    organizasyon_agaci = organizasyon_agaci_olustur(kup)
+else:
+    kup = mentor_eslestirici = organizasyon_agaci = None
 
-try:
-    secilen_satir = hesaplayici.df[hesaplayici.df["employee_name"] == secilen_kisi].iloc[0]
-    calisan_id = secilen_satir["employee_id"]
-    unvan = secilen_satir["role"]
-except IndexError:
+secilen_kisi = st.sidebar.selectbox("Çalışan Seçimi", calisan_listesi)
+kalibrasyon_acik = False
+secilen_yonetici = "—"
+if hesaplayici.paylasimli_matris is None:
+    kalibrasyon_acik = st.sidebar.checkbox("Değerlendirici Kalibrasyonu", value=False,
+                                           help="Sert/cömert değerlendirici etkisi ayıklanmış skorları da gösterir.")
+    yonetici_listesi = organizasyon_agaci.yoneticiler()["yonetici"].tolist()
+    secilen_yonetici = st.sidebar.selectbox("Ekip Görünümü (Yönetici)", ["—"] + yonetici_listesi,
+                                            help="Yöneticinin tüm alt ekibi için yetkinlik ısı haritası.")
+
+secilen_bilgi = hesaplayici.calisan_bilgisi(secilen_kisi)
+if secilen_bilgi is None:
     st.stop()
+calisan_id = secilen_bilgi["employee_id"]
+unvan = secilen_bilgi["role"]
 
-# Yaka Tipi Belirleme
-def yaka_tipi_belirle(rol):
-    beyaz_yaka_anahtarlar = ["muhendis", "yonetici", "uzman", "direktor", "mühendis", "analist", "lider"]
-    if any(x in str(rol).lower() for x in beyaz_yaka_anahtarlar):
-        return "beyaz"
-    return "mavi"
-
-yaka_tipi = yaka_tipi_belirle(unvan)
+# Yaka Tipi Belirleme (Kural backend'de: küp rollup'ları ile aynı sınıflandırma)
+yaka_tipi = hesaplayici.yaka_tipi_belirle(unvan)
 yaka_etiketi = f"{yaka_tipi.capitalize()} Yaka"
 
 # Sidebar Bilgi Kutusu
@@ -155,6 +193,8 @@ st.sidebar.markdown(f"""
 
 # Fotoğraf Bulma Mantığı
 def get_image_base64(path):
+    import base64
+    import mimetypes
     try:
         mime_type, _ = mimetypes.guess_type(path)
         with open(path, "rb") as image_file:
@@ -233,7 +273,7 @@ with col_p2:
 st.markdown('<div class="section-header">Performans Özeti</div>', unsafe_allow_html=True)
 
 kendi_skoru = sum(final_skorlar.values()) / len(final_skorlar)
-genel_ortalama = hesaplayici.df["score"].mean() if "score" in hesaplayici.df.columns else 3.5
+genel_ortalama = hesaplayici.genel_ortalama()
 net_fark = kendi_skoru - genel_ortalama
 
 c1, c2, c3 = st.columns(3)
@@ -335,6 +375,55 @@ with col_table:
     full_table_html = f"""<table class="score-table">{rows_html}</table>"""
     st.markdown(full_table_html, unsafe_allow_html=True)
 
+    # Opsiyonel: Değerlendirici comertlik/sertlik etkisi ayıklanmış skorlar
+    if kalibrasyon_acik:
+        kalibre_skorlar = hesaplayici.hesapla_kalibre(calisan_id)
+        if kalibre_skorlar:
+            st.markdown("**Kalibre Edilmiş Skorlar (Değerlendirici Etkisi Ayıklanmış)**")
+            st.dataframe(
+                pd.DataFrame([
+                    {"Yetkinlik": k, "Ham": v["ham"], "Kalibre": v["kalibre"], "Fark": round(v["kalibre"] - v["ham"], 2)}
+                    for k, v in kalibre_skorlar.items()
+                ]),
+                hide_index=True, use_container_width=True
+            )
+
+# --- KÖR NOKTA ANALİZİ (AGREGE KÜP) ---
+kor_nokta = kup.kor_nokta(calisan_id) if kup is not None else pd.DataFrame()
+
+if not kor_nokta.empty and kor_nokta[["yonetici", "diger"]].notna().any().all():
+    st.markdown('<div class="section-header">Kör Nokta Analizi</div>', unsafe_allow_html=True)
+
+    col_kor_grafik, col_kor_tablo = st.columns([3, 2])
+
+    with col_kor_grafik:
+        fig_kor = go.Figure()
+        fig_kor.add_trace(go.Bar(
+            x=kor_nokta["yetkinlik"], y=kor_nokta["yonetici"], name="Yönetici Görüşü",
+            marker_color="#1A237E"
+        ))
+        fig_kor.add_trace(go.Bar(
+            x=kor_nokta["yetkinlik"], y=kor_nokta["diger"], name="Ekip / Ast Görüşü",
+            marker_color="#90A4AE"
+        ))
+        fig_kor.update_layout(
+            barmode="group", height=340, margin=dict(t=20, b=20),
+            yaxis=dict(range=[0, 5], tickfont=dict(color="#90A4AE")),
+            legend=dict(orientation="h", y=1.1), plot_bgcolor="rgba(0,0,0,0)"
+        )
+        st.plotly_chart(fig_kor, use_container_width=True)
+
+    with col_kor_tablo:
+        st.markdown("**Rol Ortalamasına Göre Sapma**")
+        rows_html = ""
+        for _, satir in kor_nokta.sort_values("sapma", key=abs, ascending=False).iterrows():
+            if pd.isna(satir["sapma"]):
+                continue
+            renk_kor = "#D32F2F" if abs(satir["sapma"]) >= 1.0 else ("#FF9800" if abs(satir["sapma"]) >= 0.5 else "#2E7D32")
+            rows_html += f"<tr><td class='score-label'>{satir['yetkinlik']}</td><td class='score-val'>{satir['fark']:+.2f}</td><td class='score-val' style='color:{renk_kor}'>{satir['sapma']:+.2f}</td></tr>"
+        st.markdown(f"""<table class="score-table">{rows_html}</table>""", unsafe_allow_html=True)
+        st.caption("Fark: Yönetici − Ekip/Ast puanı | Sapma: Farkın aynı roldeki çalışanların ortalama farkından uzaklığı")
+
 # --- STRATEJİK GELİŞİM PLANI ---
 st.markdown('<div class="section-header">Stratejik Gelişim Planı</div>', unsafe_allow_html=True)
 
@@ -345,11 +434,14 @@ gucluler = {k: v for k, v in tavsiyeler.items() if kategoriler[k] in ["strong",
 
 col_weak, col_medium, col_strong = st.columns(3)
 
-def kart_ciz(baslik, tavsiye, skor, tip):
+def kart_ciz(baslik, tavsiye, skor, tip, mentorlar=None):
     # Stil ve İçerik Belirleme
     if tip == "weak":
         css = "card-weak"; badge_bg = "bg-weak"; label = "GELİŞİM"
         body_content = f'<div class="rec-body">{tavsiye}</div>'
+        if mentorlar:
+            mentor_metni = ", ".join(f"{m['mentor_name']} ({m['mentor_skor']:.2f})" for m in mentorlar)
+            body_content += f'<div class="rec-body"><b>Önerilen Mentorlar:</b> {mentor_metni}</div>'
     elif tip == "medium":
         css = "card-medium"; badge_bg = "bg-medium"; label = "İYİLEŞTİRME"
         body_content = f'<div class="rec-body">{tavsiye}</div>'
@@ -381,7 +473,8 @@ with col_weak:
     st.markdown('<div class="col-header header-weak">ÖNCELİKLİ GELİŞİM</div>', unsafe_allow_html=True)
     if zayiflar:
         for k, v in zayiflar.items():
-            st.markdown(kart_ciz(k, v, final_skorlar[k], "weak"), unsafe_allow_html=True)
+            mentorlar = mentor_eslestirici.mentor_oner(calisan_id, k, k=2) if mentor_eslestirici is not None else None
+            st.markdown(kart_ciz(k, v, final_skorlar[k], "weak", mentorlar), unsafe_allow_html=True)
     else:
         st.success("Bu alanda madde yok.")
 
@@ -419,4 +512,36 @@ if filtrelenmis_egitimler:
                     </div>
                     <a href="{e.get('link', '#')}" style="background:#1A237E; color:white; padding:6px 15px; border-radius:4px; text-decoration:none; font-size:12px; font-weight:600;">İncele</a>
                 </div>
-                """, unsafe_allow_html=True)
\ No newline at end of file
+                """, unsafe_allow_html=True)
+
+# --- EKİP GÖRÜNÜMÜ (ORGANİZASYON AĞACI ROLLUP'LARI) ---
+if secilen_yonetici != "—":
+    st.markdown(f'<div class="section-header">Ekip Görünümü: {secilen_yonetici}</div>', unsafe_allow_html=True)
+
+    ekip_ozeti = organizasyon_agaci.ekip_ozeti(secilen_yonetici)
+    ekip_haritasi, ekip_bilgisi = organizasyon_agaci.isi_haritasi(secilen_yonetici)
+
+    col_harita, col_ozet = st.columns([3, 2])
+
+    with col_harita:
+        fig_ekip = go.Figure(go.Heatmap(
+            z=ekip_haritasi.to_numpy(), x=ekip_haritasi.columns, y=ekip_haritasi.index,
+            zmin=1, zmax=5, colorscale=[[0, "#C62828"], [0.5, "#EF6C00"], [0.625, "#FFF59D"], [1, "#2E7D32"]],
+            text=ekip_haritasi.to_numpy(), texttemplate="%{text:.2f}", hoverongaps=False
+        ))
+        fig_ekip.update_layout(
+            height=max(260, 40 * len(ekip_haritasi) + 120), margin=dict(t=20, b=20),
+            yaxis=dict(autorange="reversed"), plot_bgcolor="rgba(0,0,0,0)"
+        )
+        st.plotly_chart(fig_ekip, use_container_width=True)
+        st.caption("Satırlar: doğrudan bağlı kişiler (+N: onların alt ekibi) | Değer: alt ekibin yetkinlik ortalaması")
+
+    with col_ozet:
+        st.markdown(f"**Ekip Özeti** ({int(ekip_ozeti['kisi_sayisi'].max()) if not ekip_ozeti.empty else 0} kişi)")
+        st.dataframe(
+            ekip_ozeti.rename(columns={
+                "yetkinlik": "Yetkinlik", "ortalama": "Ortalama", "zayif": "Zayıf",
+                "orta": "Orta", "guclu": "Güçlü", "kisi_sayisi": "Kişi"
+            }),
+            hide_index=True, use_container_width=True
+        )
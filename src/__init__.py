@@ -0,0 +1,38 @@
+"""
+360 Derece Karar Destek Sistemi - backend paketi.
+
+Siniflar ilk erisimde yuklenir (PEP 562 modul __getattr__). Boylece
+'import src' veya 'from src import TavsiyeMotoru' pandas/numpy/scipy gibi
+agir bagimliliklari, onlara ihtiyac duyan modul kullanilana kadar yuklemez.
+"""
+
+import importlib
+
+_SINIF_MODULLERI = {
+    "YetkinlikSkorHesaplayici": "src.yetkinlik_skor_hesaplayici",
+    "TavsiyeMotoru": "src.tavsiye_motoru",
+    "EtkinlikKaziyici": "src.etkinlik_kaziyici",
+    "MaddeAnalizi": "src.madde_analizi",
+    "DegerlendiriciKalibrasyonu": "src.degerlendirici_kalibrasyonu",
+    "AgregeKup": "src.agrege_kup",
+    "MentorEslestirici": "src.mentor_eslestirici",
+    "KohortPlanlayici": "src.kohort_planlayici",
+    "OrganizasyonAgaci": "src.organizasyon_agaci",
+    "PaylasimliSkorMatrisi": "src.paylasimli_skor_matrisi",
+    "VeriDogrulayici": "src.veri_dogrulayici",
+    "TopluIslem": "src.toplu_islem",
+}
+
+__all__ = list(_SINIF_MODULLERI)
+
+
+def __getattr__(ad):
+    if ad in _SINIF_MODULLERI:
+        sinif = getattr(importlib.import_module(_SINIF_MODULLERI[ad]), ad)
+        globals()[ad] = sinif
+        return sinif
+    raise AttributeError(f"module 'src' has no attribute '{ad}'")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,233 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.yetkinlik_skor_hesaplayici import YetkinlikSkorHesaplayici
+
+
+class AgregeKup:
+    """
+    Modul Amaci:
+    1. Degerlendirme tablosunu bir kez tarayip calisan x yetkinlik x degerlendirici
+       grubu x soru eksenlerinde puan TOPLAMI ve ADEDI kuplerini (yogun NumPy dizileri)
+       olusturur. Eksenler kategorik kodlarla indekslenir.
+    2. Rol ve yaka tipi icin onceden toplanmis (rollup) kupler tutar.
+    3. Dilimleme / toplama API'si ile 'Yonetici vs Ekip farki' gibi sorulari ham
+       tabloya donmeden yanitlar. Ortalama ve farklar her zaman toplam/adet
+       uzerinden turetilir (ortalamalarin ortalamasi alinmaz).
+    """
+
+    EKSENLER = ("calisan", "yetkinlik", "grup", "soru")
+    # Rolu bos calisanlar rollup'lardan dusmesin diye ayri bir role toplanir
+    BOS_ROL = "Belirtilmemiş"
+
+    def __init__(self, hesaplayici):
+        self.hesaplayici = hesaplayici
+        df = hesaplayici.df
+
+        # --- 1. KATEGORIK KODLAR ---
+        cal_kod, self.calisan_idleri = pd.factorize(df["employee_id"], sort=True)
+        yet_kod, self.yetkinlik_adlari = hesaplayici.yetkinlik_kodlari()
+        grup_kod, self.grup_adlari = pd.factorize(df["evaluator_group"], sort=True)
+        soru_kod, self.soru_adlari = pd.factorize(df["question_id"], sort=True)
+        puan = df["score"].to_numpy(dtype=float)
+        # Bos puan veya bos etiket (kod -1) iceren satirlar kupe girmez
+        m = ~np.isnan(puan) & (cal_kod >= 0) & (yet_kod >= 0) & (grup_kod >= 0) & (soru_kod >= 0)
+
+        self.etiketler = {
+            "calisan": np.asarray(self.calisan_idleri),
+            "yetkinlik": np.asarray(self.yetkinlik_adlari),
+            "grup": np.asarray(self.grup_adlari),
+            "soru": np.asarray(self.soru_adlari),
+        }
+        self._indeks = {ad: {e: i for i, e in enumerate(et)} for ad, et in self.etiketler.items()}
+        sekil = tuple(len(self.etiketler[e]) for e in self.EKSENLER)
+
+        # --- 2. ANA KUP (tek bincount gecisi) ---
+        duz = np.ravel_multi_index((cal_kod[m], yet_kod[m], grup_kod[m], soru_kod[m]), sekil)
+        boyut = int(np.prod(sekil))
+        self.toplam = np.bincount(duz, weights=puan[m], minlength=boyut).reshape(sekil)
+        self.adet = np.bincount(duz, minlength=boyut).astype(np.int32).reshape(sekil)
+
+        # --- 3. ROL / YAKA ROLLUP KUPLERI ---
+        # Her calisanin rolu: ilk satirdaki deger (rol calisan bazinda sabittir).
+        # Kimligi bos satirlar (kod -1) calisan ekseninde yer almaz.
+        kimlikli = np.flatnonzero(cal_kod >= 0)
+        ilk_satir = kimlikli[np.unique(cal_kod[kimlikli], return_index=True)[1]]
+        roller = df["role"].fillna(self.BOS_ROL).to_numpy()[ilk_satir]
+        self.calisan_rol_kod, self.rol_adlari = pd.factorize(roller, sort=True)
+        self.rol_yaka = np.array([hesaplayici.yaka_tipi_belirle(r) for r in self.rol_adlari], dtype=object)
+        self.yaka_adlari = np.unique(self.rol_yaka) if len(self.rol_yaka) else np.array([], dtype=object)
+
+        self.rol_toplam, self.rol_adet = self._rollup(self.toplam, self.adet, self.calisan_rol_kod, len(self.rol_adlari))
+        rol_yaka_kod = np.searchsorted(self.yaka_adlari, self.rol_yaka)
+        self.yaka_toplam, self.yaka_adet = self._rollup(self.rol_toplam, self.rol_adet, rol_yaka_kod, len(self.yaka_adlari))
+        self.genel_toplam = self.yaka_toplam.sum(axis=0)
+        self.genel_adet = self.yaka_adet.sum(axis=0)
+
+    @staticmethod
+    def _rollup(toplam, adet, ust_kod, ust_sayi):
+        """
+        Ilk eksendeki kayitlari ust koda gore toplar (siralama + np.add.reduceat).
+        """
+        sekil = (ust_sayi,) + toplam.shape[1:]
+        yeni_toplam = np.zeros(sekil)
+        yeni_adet = np.zeros(sekil, dtype=np.int64)
+        # Negatif kod (bos etiket) hicbir ust satira yazilmaz
+        sira = np.flatnonzero(ust_kod >= 0)
+        if len(sira) == 0:
+            return yeni_toplam, yeni_adet
+
+        sira = sira[np.argsort(ust_kod[sira], kind="stable")]
+        kodlar = ust_kod[sira]
+        baslar = np.flatnonzero(np.r_[True, kodlar[1:] != kodlar[:-1]])
+        yeni_toplam[kodlar[baslar]] = np.add.reduceat(toplam[sira], baslar, axis=0)
+        yeni_adet[kodlar[baslar]] = np.add.reduceat(adet[sira], baslar, axis=0)
+        return yeni_toplam, yeni_adet
+
+    # ============================================================
+    # BOLUM A: DILIMLEME VE TOPLAMA
+    # ============================================================
+
+    def _secici(self, eksen, deger):
+        """
+        Tek etiket veya etiket listesini indeks dizisine cevirir.
+        None -> eksenin tamami (slice).
+        """
+        if deger is None:
+            return slice(None)
+        degerler = deger if isinstance(deger, (list, tuple, set, np.ndarray)) else [deger]
+        indeks = self._indeks[eksen]
+        return np.array([indeks[d] for d in degerler if d in indeks], dtype=np.intp)
+
+    def _rol_secimi(self, rol, yaka):
+        """
+        Rol ve/veya yaka filtresini rol indekslerine indirger.
+        """
+        roller = np.arange(len(self.rol_adlari))
+        if rol is not None:
+            istenen = set(rol if isinstance(rol, (list, tuple, set)) else [rol])
+            roller = roller[np.isin(self.rol_adlari, list(istenen))]
+        if yaka is not None:
+            istenen = set(yaka if isinstance(yaka, (list, tuple, set)) else [yaka])
+            roller = roller[np.isin(self.rol_yaka[roller], list(istenen))]
+        return roller
+
+    def dilim(self, kalsin=("yetkinlik",), calisan=None, yetkinlik=None, grup=None, soru=None, rol=None, yaka=None):
+        """
+        Filtrelenmis kupun toplam ve adet dizilerini dondurur.
+        'kalsin' disindaki eksenler toplanir. Calisan filtresi yoksa rol/yaka/genel
+        rollup kupleri kullanilir; boylece cevap kup boyutundan bagimsizdir.
+        """
+        if calisan is not None:
+            toplam, adet = self.toplam, self.adet
+            ilk = self._secici("calisan", calisan)
+            if rol is not None or yaka is not None:
+                uygun = np.isin(self.calisan_rol_kod[ilk], self._rol_secimi(rol, yaka))
+                ilk = ilk[uygun]
+        elif rol is not None:
+            toplam, adet = self.rol_toplam, self.rol_adet
+            ilk = self._rol_secimi(rol, yaka)
+        elif yaka is not None:
+            toplam, adet = self.yaka_toplam, self.yaka_adet
+            ilk = np.flatnonzero(np.isin(self.yaka_adlari, list(yaka) if isinstance(yaka, (list, tuple, set)) else [yaka]))
+        else:
+            toplam, adet = self.genel_toplam[np.newaxis], self.genel_adet[np.newaxis]
+            ilk = slice(None)
+
+        secim = (ilk, self._secici("yetkinlik", yetkinlik), self._secici("grup", grup), self._secici("soru", soru))
+        # Her eksende ayri ayri indeksle (np.ix_ benzeri, dilimlerle uyumlu)
+        for eksen, s in enumerate(secim):
+            toplam = toplam[(slice(None),) * eksen + (s,)]
+            adet = adet[(slice(None),) * eksen + (s,)]
+
+        toplanacak = tuple(i for i, e in enumerate(self.EKSENLER) if e not in kalsin)
+        return toplam.sum(axis=toplanacak), adet.sum(axis=toplanacak)
+
+    def ortalama(self, kalsin=("yetkinlik",), **filtre):
+        """
+        Dilimin ortalamasini toplam/adet uzerinden hesaplar.
+        Tek eksen kalirsa etiketli Series, aksi halde ham dizi doner.
+        """
+        toplam, adet = self.dilim(kalsin=kalsin, **filtre)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            ort = toplam / adet
+        if len(kalsin) == 1 and kalsin[0] != "calisan":
+            etiket = self.etiketler[kalsin[0]][self._secici(kalsin[0], filtre.get(kalsin[0]))]
+            return pd.Series(ort, index=etiket)
+        return ort
+
+    def grup_farki(self, grup_a, grup_b, **filtre):
+        """
+        Yetkinlik bazinda (grup_a ortalamasi - grup_b ortalamasi).
+        Orn: kup.grup_farki(kup.yonetici_gruplari(), "Ekip", rol="Mühendis")
+        """
+        filtre.pop("grup", None)
+        return self.ortalama(grup=grup_a, **filtre) - self.ortalama(grup=grup_b, **filtre)
+
+    def yonetici_gruplari(self):
+        """
+        'Yönetici', '1.Yönetici', '2.Yönetici' gibi tum yonetici gruplarini dondurur.
+        """
+        return [g for g in self.etiketler["grup"] if "yönetici" in str(g).lower()]
+
+    def calisan_matrisi(self):
+        """
+        Calisan x yetkinlik ortalama puan matrisini (tum grup ve sorular uzerinden)
+        dondurur. Puani olmayan hucreler NaN kalir.
+        """
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.toplam.sum(axis=(2, 3)) / self.adet.sum(axis=(2, 3))
+
+    # ============================================================
+    # BOLUM B: KOR NOKTA ANALIZI
+    # ============================================================
+
+    def kor_nokta(self, calisan_id):
+        """
+        Calisanin yonetici gozuyle aldigi puan ile diger gruplarin (Ekip, Ast ...)
+        puani arasindaki farki, ayni roldeki calisanlarin ortalama farkiyla kiyaslar.
+        Buyuk pozitif/negatif sapma bir 'kor nokta' isaretidir.
+        """
+        yoneticiler = self.yonetici_gruplari()
+        digerleri = [g for g in self.etiketler["grup"] if g not in yoneticiler]
+        if calisan_id not in self._indeks["calisan"]:
+            return pd.DataFrame(columns=["yetkinlik", "yonetici", "diger", "fark", "rol_fark", "sapma"])
+
+        rol = self.rol_adlari[self.calisan_rol_kod[self._indeks["calisan"][calisan_id]]]
+        yonetici = self.ortalama(calisan=calisan_id, grup=yoneticiler)
+        diger = self.ortalama(calisan=calisan_id, grup=digerleri)
+        rol_fark = self.grup_farki(yoneticiler, digerleri, rol=rol)
+
+        sonuc = pd.DataFrame({
+            "yetkinlik": self.etiketler["yetkinlik"],
+            "yonetici": yonetici.to_numpy(),
+            "diger": diger.to_numpy(),
+        })
+        sonuc["fark"] = sonuc["yonetici"] - sonuc["diger"]
+        sonuc["rol_fark"] = rol_fark.to_numpy()
+        sonuc["sapma"] = sonuc["fark"] - sonuc["rol_fark"]
+        return sonuc.round(2)
+
+
+if __name__ == "__main__":
+    import time
+
+    kok = Path(__file__).parent.parent
+    hesaplayici = YetkinlikSkorHesaplayici(kok / "data" / "input" / "faz0_sentetik_veri.csv")
+    kup = AgregeKup(hesaplayici)
+
+    print("--- Yonetici vs Ekip Farki (Tum Muhendisler) ---")
+    baslangic = time.perf_counter()
+    fark = kup.grup_farki(kup.yonetici_gruplari(), "Ekip", rol="Mühendis")
+    sure = (time.perf_counter() - baslangic) * 1e6
+    print(fark.round(2).to_string())
+    print(f"Sorgu suresi: {sure:.0f} mikrosaniye")
+
+    print("\n--- Yaka Tipine Gore Yetkinlik Ortalamalari ---")
+    for yaka in kup.yaka_adlari:
+        print(yaka, kup.ortalama(yaka=yaka).round(2).to_dict())
+
+    print("\n--- Kor Nokta (Ilk Calisan) ---")
+    print(kup.kor_nokta(kup.calisan_idleri[0]).to_string(index=False))
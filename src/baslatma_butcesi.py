@@ -0,0 +1,100 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+
+class BaslatmaButcesi:
+    """
+    Modul Amaci: Import-zamani butce kontrolu.
+    Her modulu temiz bir Python surecinde import eder; sureyi ve yuklenen agir
+    bagimliliklari olcer. Butce asilirsa veya yasak bir bagimlilik yuklenirse
+    basarisiz sayilir (CI / cron icin 'python -m src.baslatma_butcesi', cikis kodu 1).
+
+    Katmanlar:
+    - hafif: CLI, toplu is girisi ve kural motorlari; pandas/numpy dahil hicbir
+      agir bagimlilik import aninda yuklenmez.
+    - analiz: sayisal moduller; numpy/pandas (ve gerekiyorsa scipy) serbest,
+      cizim / PDF / Streamlit yasak.
+    """
+
+    AGIR_BAGIMLILIKLAR = ["pandas", "numpy", "scipy", "streamlit", "plotly", "matplotlib", "fpdf"]
+    ARAYUZ_BAGIMLILIKLARI = ["streamlit", "plotly", "matplotlib", "fpdf"]
+
+    # (modul, butce_ms, yasak bagimliliklar)
+    KONTROLLER = [
+        ("src", 50, AGIR_BAGIMLILIKLAR),
+        ("src.tavsiye_motoru", 50, AGIR_BAGIMLILIKLAR),
+        ("src.yetkinlik_skor_hesaplayici", 50, AGIR_BAGIMLILIKLAR),
+        ("src.etkinlik_kaziyici", 50, AGIR_BAGIMLILIKLAR),
+        ("src.toplu_islem", 50, AGIR_BAGIMLILIKLAR),
+        ("src.veri_dogrulayici", 600, ARAYUZ_BAGIMLILIKLARI + ["scipy"]),
+        ("src.madde_analizi", 600, ARAYUZ_BAGIMLILIKLARI + ["scipy"]),
+        ("src.agrege_kup", 600, ARAYUZ_BAGIMLILIKLARI + ["scipy"]),
+        ("src.mentor_eslestirici", 600, ARAYUZ_BAGIMLILIKLARI + ["scipy"]),
+        ("src.kohort_planlayici", 600, ARAYUZ_BAGIMLILIKLARI + ["scipy"]),
+        ("src.organizasyon_agaci", 600, ARAYUZ_BAGIMLILIKLARI + ["scipy"]),
+        ("src.paylasimli_skor_matrisi", 300, ARAYUZ_BAGIMLILIKLARI + ["scipy", "pandas"]),
+        ("src.degerlendirici_kalibrasyonu", 800, ARAYUZ_BAGIMLILIKLARI),
+    ]
+    TEKRAR = 3
+
+    # Alt surecte calisan olcum kodu: import suresi (ms) + yuklenen agir moduller
+    _OLCUM_KODU = (
+        "import json, sys, time\n"
+        "t = time.perf_counter()\n"
+        "import {modul}\n"
+        "sure = (time.perf_counter() - t) * 1000\n"
+        "yuklenen = sorted({{m.split('.')[0] for m in sys.modules}} & set({agir!r}))\n"
+        "print(json.dumps({{'sure_ms': sure, 'yuklenen': yuklenen}}))\n"
+    )
+
+    def __init__(self, kontroller=None, tekrar=None):
+        self.kok_dizin = Path(__file__).parent.parent
+        self.kontroller = kontroller or self.KONTROLLER
+        self.tekrar = tekrar or self.TEKRAR
+
+    def _olc(self, modul):
+        """
+        Modulu temiz bir surecte import eder; en iyi (minimum) sureyi dondurur.
+        """
+        kod = self._OLCUM_KODU.format(modul=modul, agir=self.AGIR_BAGIMLILIKLAR)
+        sonuclar = []
+        for _ in range(self.tekrar):
+            cikti = subprocess.run(
+                [sys.executable, "-c", kod], cwd=self.kok_dizin,
+                capture_output=True, text=True, check=True,
+            )
+            sonuclar.append(json.loads(cikti.stdout.strip().splitlines()[-1]))
+        return min(sonuclar, key=lambda s: s["sure_ms"])
+
+    def calistir(self):
+        """
+        Tum kontrolleri calistirir; (basarili_mi, satirlar) dondurur.
+        """
+        satirlar = []
+        for modul, butce_ms, yasaklar in self.kontroller:
+            olcum = self._olc(modul)
+            ihlal = sorted(set(olcum["yuklenen"]) & set(yasaklar))
+            satirlar.append({
+                "modul": modul,
+                "sure_ms": round(olcum["sure_ms"], 1),
+                "butce_ms": butce_ms,
+                "yasak_yuklenen": ihlal,
+                "basarili": olcum["sure_ms"] <= butce_ms and not ihlal,
+            })
+        return all(s["basarili"] for s in satirlar), satirlar
+
+
+if __name__ == "__main__":
+    basarili, satirlar = BaslatmaButcesi().calistir()
+
+    print(f"{'MODUL':<36} {'SURE':>9} {'BUTCE':>8}  DURUM")
+    print("-" * 70)
+    for s in satirlar:
+        durum = "OK" if s["basarili"] else "ASILDI"
+        if s["yasak_yuklenen"]:
+            durum += f" (yasak: {', '.join(s['yasak_yuklenen'])})"
+        print(f"{s['modul']:<36} {s['sure_ms']:>7.1f}ms {s['butce_ms']:>6}ms  {durum}")
+
+    sys.exit(0 if basarili else 1)
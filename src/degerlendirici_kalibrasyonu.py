@@ -0,0 +1,119 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from scipy.sparse.linalg import lsqr
+
+from src.yetkinlik_skor_hesaplayici import YetkinlikSkorHesaplayici
+
+
+class DegerlendiriciKalibrasyonu:
+    """
+    Modul Amaci:
+    1. Her yetkinlik icin puanlari toplamsal bir modelle ayristirir:
+           puan = genel_ort + calisan_etkisi + degerlendirici_etkisi + hata
+    2. Model, degerlendirici x calisan gelis (incidence) matrisi uzerinde seyrek
+       en kucuk kareler (scipy LSQR) ile cozulur; yogun pivot tablo kurulmaz.
+    3. Degerlendirici etkisi (comertlik / sertlik) cikarilmis 'kalibre' skoru
+       ham skorla yan yana sunar.
+
+    Bellek kullanimi puan sayisiyla dogrusaldir (satir basina 2 sifirdan farkli eleman).
+    """
+
+    # LSQR icin ridge (damp) katsayisi: az puan vermis degerlendiricilerin
+    # etkisini sifira dogru ceker ve modeli tanimli hale getirir.
+    SONUMLEME = 0.5
+    MAKS_ITERASYON = 200
+
+    def __init__(self, hesaplayici, sonumleme=None):
+        self.hesaplayici = hesaplayici
+        self.df = hesaplayici.df
+        self.sonumleme = self.SONUMLEME if sonumleme is None else sonumleme
+
+        self.calisan_etkileri = None
+        self.degerlendirici_etkileri = None
+
+    def _yetkinlik_coz(self, calisan, degerlendirici, puan):
+        """
+        Tek bir yetkinlik icin seyrek sistemi kurar ve cozer.
+        Donus: (calisan_ids, ham_ort, kalibre, n_calisan, deg_ids, deg_etki, n_deg)
+        """
+        e_kod, e_ids = pd.factorize(calisan)
+        r_kod, r_ids = pd.factorize(degerlendirici)
+        n, n_e, n_r = len(puan), len(e_ids), len(r_ids)
+
+        # Her puan satiri: bir calisan kolonu + bir degerlendirici kolonu = 1
+        satirlar = np.concatenate([np.arange(n), np.arange(n)])
+        kolonlar = np.concatenate([e_kod, n_e + r_kod])
+        X = sp.csr_matrix((np.ones(2 * n), (satirlar, kolonlar)), shape=(n, n_e + n_r))
+
+        genel_ort = puan.mean()
+        theta = lsqr(X, puan - genel_ort, damp=self.sonumleme, iter_lim=self.MAKS_ITERASYON)[0]
+        a, b = theta[:n_e], theta[n_e:]
+
+        # Degerlendirici etkilerini puan agirlikli sifir ortalamaya tasi;
+        # kayan sabit calisan etkisine eklenir (tahminler degismez).
+        n_deg = np.bincount(r_kod, minlength=n_r)
+        kayma = np.average(b, weights=n_deg)
+        b = b - kayma
+        a = a + kayma
+
+        n_cal = np.bincount(e_kod, minlength=n_e)
+        ham = np.bincount(e_kod, weights=puan, minlength=n_e) / n_cal
+        kalibre = genel_ort + a
+        return e_ids, ham, kalibre, n_cal, r_ids, b, n_deg
+
+    def kalibre_et(self):
+        """
+        Tum yetkinlikler icin modeli cozer ve iki tablo uretir:
+        - calisan_etkileri: employee_id, yetkinlik, n, ham_skor, kalibre_skor
+        - degerlendirici_etkileri: evaluator_name, yetkinlik, n, etki (+ comert, - sert)
+        """
+        yetkinlik_kod, yetkinlik_adlari = self.hesaplayici.yetkinlik_kodlari()
+        puan = self.df["score"].to_numpy(dtype=float)
+        calisanlar = self.df["employee_id"].to_numpy()
+        degerlendiriciler = self.df["evaluator_name"].to_numpy()
+        # Bos puan, bos yetkinlik (kod -1) veya kimligi bos satirlar modele girmez
+        gecerli = (
+            ~np.isnan(puan) & (yetkinlik_kod >= 0)
+            & pd.notna(calisanlar) & pd.notna(degerlendiriciler)
+        )
+
+        cal_parcalar, deg_parcalar = [], []
+        for no, ad in enumerate(yetkinlik_adlari):
+            m = gecerli & (yetkinlik_kod == no)
+            if not m.any():
+                continue
+            e_ids, ham, kalibre, n_cal, r_ids, etki, n_deg = self._yetkinlik_coz(
+                calisanlar[m], degerlendiriciler[m], puan[m]
+            )
+            cal_parcalar.append(pd.DataFrame({
+                "employee_id": e_ids, "yetkinlik": ad, "n": n_cal,
+                "ham_skor": ham, "kalibre_skor": kalibre,
+            }))
+            deg_parcalar.append(pd.DataFrame({
+                "evaluator_name": r_ids, "yetkinlik": ad, "n": n_deg, "etki": etki,
+            }))
+
+        bos_cal = pd.DataFrame(columns=["employee_id", "yetkinlik", "n", "ham_skor", "kalibre_skor"])
+        bos_deg = pd.DataFrame(columns=["evaluator_name", "yetkinlik", "n", "etki"])
+        self.calisan_etkileri = pd.concat(cal_parcalar, ignore_index=True) if cal_parcalar else bos_cal
+        self.degerlendirici_etkileri = pd.concat(deg_parcalar, ignore_index=True) if deg_parcalar else bos_deg
+        return self.calisan_etkileri, self.degerlendirici_etkileri
+
+
+if __name__ == "__main__":
+    kok = Path(__file__).parent.parent
+    hesaplayici = YetkinlikSkorHesaplayici(kok / "data" / "input" / "faz0_sentetik_veri.csv")
+
+    kalibrasyon = DegerlendiriciKalibrasyonu(hesaplayici)
+    calisan_tablosu, degerlendirici_tablosu = kalibrasyon.kalibre_et()
+
+    print("--- En Sert / En Comert Degerlendiriciler (Yetkinlik Ortalamasi) ---")
+    ozet = degerlendirici_tablosu.groupby("evaluator_name")["etki"].mean().sort_values()
+    print(ozet.round(3).to_string())
+
+    print("\n--- Ornek Calisan: Ham vs Kalibre ---")
+    ornek_id = hesaplayici.df.iloc[0]["employee_id"]
+    print(hesaplayici.hesapla_kalibre(ornek_id))
@@ -1,5 +1,4 @@
 import os
-import pandas as pd
 from src.tavsiye_motoru import TavsiyeMotoru
 
 class EtkinlikKaziyici:
@@ -17,6 +16,8 @@ class EtkinlikKaziyici:
         """
         CSV dosyasini okur ve kolon isimlerini standartlastirir.
         """
+        import pandas as pd
+
         if not os.path.exists(self.csvYolu):
             return pd.DataFrame(columns=["ad", "tema", "tarih", "lokasyon", "ucret", "link"])
         
@@ -0,0 +1,166 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.agrege_kup import AgregeKup
+from src.etkinlik_kaziyici import EtkinlikKaziyici
+from src.yetkinlik_skor_hesaplayici import YetkinlikSkorHesaplayici
+
+
+class KohortPlanlayici:
+    """
+    Modul Amaci:
+    1. Calisan x yetkinlik skor matrisinden her calisanin 'eksik profili'ni
+       (esik puanin ne kadar altinda oldugu) cikarir.
+    2. Benzer eksik profillerini deterministik tohumlu mini-batch k-means ile
+       kohortlara ayirir (saf NumPy).
+    3. Her kohort icin merkez profil, uye listesi ve katalogdan onerilen
+       egitim temalarini uretir; tek atolye butun kohorta hizmet edebilir.
+    """
+
+    KOHORT_SAYISI = 8
+    PARTI_BOYUTU = 1024
+    ITERASYON = 100
+    TOHUM = 42
+
+    def __init__(self, kup, etkinlik_kaziyici, kohort_sayisi=None, esik_puani=3.5, tohum=None):
+        self.kup = kup
+        self.kaziyici = etkinlik_kaziyici
+        self.kohort_sayisi = kohort_sayisi or self.KOHORT_SAYISI
+        self.esik_puani = esik_puani
+        self.tohum = self.TOHUM if tohum is None else tohum
+
+        self.calisan_idleri = np.asarray(kup.calisan_idleri)
+        self.yetkinlik_adlari = list(kup.yetkinlik_adlari)
+        skorlar = kup.calisan_matrisi()
+
+        # Puani olmayan yetkinlik eksik sayilmaz (esik degeriyle doldurulur)
+        self.skorlar = np.where(np.isnan(skorlar), self.esik_puani, skorlar)
+        self.eksikler = np.clip(self.esik_puani - self.skorlar, 0.0, None)
+
+        self.etiketler = None
+        self.merkezler = None
+
+    # ============================================================
+    # BOLUM A: MINI-BATCH K-MEANS
+    # ============================================================
+
+    def _kmeans_pp(self, X, k, rng):
+        """
+        k-means++ baslangici: ilk merkez rastgele, sonrakiler uzaklik^2 ile orantili.
+        """
+        merkezler = np.empty((k, X.shape[1]))
+        merkezler[0] = X[rng.integers(len(X))]
+        d2 = ((X - merkezler[0]) ** 2).sum(axis=1)
+        for i in range(1, k):
+            toplam = d2.sum()
+            secilen = rng.choice(len(X), p=d2 / toplam) if toplam > 0 else rng.integers(len(X))
+            merkezler[i] = X[secilen]
+            d2 = np.minimum(d2, ((X - merkezler[i]) ** 2).sum(axis=1))
+        return merkezler
+
+    @staticmethod
+    def _ata(X, merkezler):
+        """
+        Her satiri en yakin merkeze atar: ||x||^2 + ||c||^2 - 2 x.c
+        """
+        d2 = (X * X).sum(axis=1)[:, None] + (merkezler * merkezler).sum(axis=1)[None, :] - 2.0 * X @ merkezler.T
+        return d2.argmin(axis=1)
+
+    def kumele(self):
+        """
+        Eksik profilleri kumeler; etiketleri ve merkezleri dondurur.
+        Merkez guncellemesi merkez bazli ogrenme orani (1 / gorulen ornek) ile yapilir.
+        """
+        X = self.eksikler
+        n = len(X)
+        if n == 0:
+            self.etiketler, self.merkezler = np.array([], dtype=int), np.empty((0, X.shape[1]))
+            return self.etiketler, self.merkezler
+
+        k = min(self.kohort_sayisi, n)
+        rng = np.random.default_rng(self.tohum)
+        ornek = X[rng.choice(n, size=min(n, 10 * self.PARTI_BOYUTU), replace=False)]
+        merkezler = self._kmeans_pp(ornek, k, rng)
+        sayac = np.zeros(k)
+
+        parti = min(self.PARTI_BOYUTU, n)
+        for _ in range(self.ITERASYON):
+            P = X[rng.choice(n, size=parti, replace=False)]
+            atama = self._ata(P, merkezler)
+
+            # Parti icindeki toplam ve adetler tek seferde; sirali SGD ile esdeger kapali form
+            adet = np.bincount(atama, minlength=k).astype(float)
+            toplam = np.zeros_like(merkezler)
+            np.add.at(toplam, atama, P)
+            sayac += adet
+            dolu = adet > 0
+            oran = adet[dolu] / sayac[dolu]
+            merkezler[dolu] = (1 - oran)[:, None] * merkezler[dolu] + oran[:, None] * (toplam[dolu] / adet[dolu, None])
+
+        self.etiketler = self._ata(X, merkezler)
+        self.merkezler = merkezler
+        return self.etiketler, self.merkezler
+
+    # ============================================================
+    # BOLUM B: KOHORT RAPORU
+    # ============================================================
+
+    def kohort_raporu(self):
+        """
+        Her kohort icin uye sayisi, ortalama skor profili, gelisim alanlari ve
+        katalogdan onerilen tema/etkinlikleri dondurur (buyukten kucuge).
+        """
+        if self.etiketler is None:
+            self.kumele()
+
+        k = len(self.merkezler)
+        adet = np.bincount(self.etiketler, minlength=k)
+        toplam = np.zeros((k, self.skorlar.shape[1]))
+        np.add.at(toplam, self.etiketler, self.skorlar)
+
+        satirlar = []
+        for no in np.argsort(-adet, kind="stable"):
+            if adet[no] == 0:
+                continue
+            profil = dict(zip(self.yetkinlik_adlari, np.round(toplam[no] / adet[no], 2)))
+            oneriler = self.kaziyici.topluEtkinlikOner(profil, esikPuani=self.esik_puani)
+            zayif_alanlar = sorted((a for a in profil if profil[a] < self.esik_puani), key=profil.get)
+            temalar = [self.kaziyici._temaEslemesiYap(self.kaziyici.motor._yetkinlikAnahtariniBul(a)) for a in zayif_alanlar]
+
+            satir = {"kohort": int(no), "uye_sayisi": int(adet[no])}
+            satir.update(profil)
+            satir["gelisim_alanlari"] = ", ".join(zayif_alanlar)
+            satir["onerilen_temalar"] = ", ".join(temalar)
+            satir["onerilen_etkinlikler"] = "; ".join(e["ad"] for liste in oneriler.values() for e in liste)
+            satirlar.append(satir)
+        return pd.DataFrame(satirlar)
+
+    def uye_listesi(self):
+        """
+        Calisan -> kohort atamasi.
+        """
+        if self.etiketler is None:
+            self.kumele()
+        df = self.kup.hesaplayici.df
+        isimler = df.drop_duplicates("employee_id").set_index("employee_id")["employee_name"]
+        return pd.DataFrame({
+            "employee_id": self.calisan_idleri,
+            "employee_name": isimler.reindex(self.calisan_idleri).to_numpy(),
+            "kohort": self.etiketler,
+        })
+
+
+if __name__ == "__main__":
+    kok = Path(__file__).parent.parent
+    hesaplayici = YetkinlikSkorHesaplayici(kok / "data" / "input" / "faz0_sentetik_veri.csv")
+    kaziyici = EtkinlikKaziyici(str(kok / "data" / "input" / "etkinlik_listesi.csv"))
+
+    planlayici = KohortPlanlayici(AgregeKup(hesaplayici), kaziyici, kohort_sayisi=3)
+
+    print("--- Kohort Raporu ---")
+    print(planlayici.kohort_raporu()[["kohort", "uye_sayisi", "gelisim_alanlari", "onerilen_temalar"]].to_string(index=False))
+
+    print("\n--- Uye Listesi ---")
+    print(planlayici.uye_listesi().to_string(index=False))
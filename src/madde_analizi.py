@@ -0,0 +1,302 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.yetkinlik_skor_hesaplayici import YetkinlikSkorHesaplayici
+
+
+class MaddeAnalizi:
+    """
+    Modul Amaci:
+    1. Degerlendirme tablosundaki her sorunun (question_id) populasyon genelinde
+       ortalama ve varyansini cikarir.
+    2. Her yetkinlik icin duzeltilmis madde-toplam korelasyonu, Cronbach alfa ve
+       'madde silinirse alfa' degerlerini hesaplar.
+    3. Her degerlendirici grubu icin degerlendiriciler arasi uyumu (ICC(1), rwg) olcer.
+    4. Soru tasarim ekibinin zayif maddeleri ayiklayabilecegi raporu yazar.
+
+    Tum hesaplar kategorik kodlar + np.bincount / matris islemleri ile yapilir;
+    satir bazli Python dongusu yoktur.
+    """
+
+    # Raporda 'zayif madde' sayilacak esikler
+    MIN_MADDE_TOPLAM_R = 0.30
+    MIN_YANIT = 10
+
+    # 1-5 likert olcegi icin duzgun dagilim varyansi: (A^2 - 1) / 12
+    BEKLENEN_VARYANS = (5 ** 2 - 1) / 12
+
+    def __init__(self, hesaplayici, yetkinlik_yolu=None):
+        self.hesaplayici = hesaplayici
+        self.kok_dizin = hesaplayici.kok_dizin
+        self.df = hesaplayici.df
+        self.mapping = hesaplayici.mapping
+
+        if yetkinlik_yolu is None:
+            yetkinlik_yolu = self.kok_dizin / "lookup" / "yetkinlikler.json"
+        try:
+            with open(yetkinlik_yolu, "r", encoding="utf-8") as f:
+                self.yetkinlikler = json.load(f)
+        except Exception as e:
+            print(f"Bilgi: Yetkinlik dosyasi okunamadi, soru metinleri bos kalacak. ({e})")
+            self.yetkinlikler = {}
+
+        self._kodla()
+
+    # ============================================================
+    # BOLUM A: KATEGORIK KODLAMA
+    # ============================================================
+
+    def _kodla(self):
+        """
+        Ham tabloyu bir kez tarayip her boyutu tamsayi koda cevirir.
+        Yetkinlik etiketleri ('Analitik', 'Süreç' ...) ekran ismine normalize edilir.
+        """
+        df = self.df
+
+        self.yetkinlik_kod, self.yetkinlik_adlari = self.hesaplayici.yetkinlik_kodlari()
+
+        self.soru_kod, self.soru_adlari = pd.factorize(df["question_id"], sort=True)
+        self.calisan_kod, self.calisan_idleri = pd.factorize(df["employee_id"], sort=True)
+        self.degerlendirici_kod, self.degerlendirici_adlari = pd.factorize(df["evaluator_name"], sort=True)
+        self.grup_kod, self.grup_adlari = pd.factorize(df["evaluator_group"], sort=True)
+        self.puan = df["score"].to_numpy(dtype=float)
+
+        # NaN puanlar ve bos etiketler (kod -1) hicbir istatistige girmez
+        self.gecerli = (
+            ~np.isnan(self.puan) & (self.yetkinlik_kod >= 0) & (self.soru_kod >= 0)
+            & (self.calisan_kod >= 0) & (self.grup_kod >= 0)
+        )
+
+    def _teknik_isim(self, ekran_ismi):
+        """
+        Ekran ismini ('Analitik Düşünme') yetkinlikler.json anahtarina cevirir.
+        """
+        ters = {v: k for k, v in self.mapping.items()}
+        return ters.get(ekran_ismi)
+
+    def _soru_metni(self, ekran_ismi, soru_id):
+        """
+        'Q2' gibi bir kimligi yetkinlikler.json icindeki soru metnine eslestirir.
+        """
+        sorular = self.yetkinlikler.get(self._teknik_isim(ekran_ismi), {}).get("sorular", [])
+        try:
+            sira = int(str(soru_id).lstrip("Qq")) - 1
+        except ValueError:
+            return ""
+        return sorular[sira] if 0 <= sira < len(sorular) else ""
+
+    # ============================================================
+    # BOLUM B: MADDE ISTATISTIKLERI
+    # ============================================================
+
+    def soru_istatistikleri(self):
+        """
+        Her (yetkinlik, soru) ikilisi icin n, ortalama ve varyansi tek bincount
+        geciniyle hesaplar.
+        """
+        m = self.gecerli
+        n_soru = len(self.soru_adlari)
+        hucre = self.yetkinlik_kod[m] * n_soru + self.soru_kod[m]
+        boyut = len(self.yetkinlik_adlari) * n_soru
+        x = self.puan[m]
+
+        n = np.bincount(hucre, minlength=boyut)
+        toplam = np.bincount(hucre, weights=x, minlength=boyut)
+        kare = np.bincount(hucre, weights=x * x, minlength=boyut)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            ort = toplam / n
+            varyans = (kare - n * ort * ort) / (n - 1)
+
+        dolu = np.flatnonzero(n)
+        return pd.DataFrame({
+            "yetkinlik": self.yetkinlik_adlari[dolu // n_soru],
+            "soru_id": np.asarray(self.soru_adlari)[dolu % n_soru],
+            "n": n[dolu],
+            "ortalama": ort[dolu].round(3),
+            "varyans": varyans[dolu].round(3),
+        })
+
+    def _yanit_matrisi(self, yetkinlik_no):
+        """
+        Bir yetkinlik icin (degerlendirici x calisan) yanit satirlari ve soru
+        kolonlarindan olusan matrisi kurar. Eksik yanitlar NaN kalir.
+        """
+        m = self.gecerli & (self.yetkinlik_kod == yetkinlik_no)
+        soru_kod, soru_ids = pd.factorize(self.soru_kod[m], sort=True)
+        n_deg = len(self.degerlendirici_adlari)
+        yanit_kod, _ = pd.factorize(self.calisan_kod[m].astype(np.int64) * n_deg + self.degerlendirici_kod[m])
+
+        matris = np.full((yanit_kod.max() + 1 if len(yanit_kod) else 0, len(soru_ids)), np.nan)
+        matris[yanit_kod, soru_kod] = self.puan[m]
+        return matris, np.asarray(self.soru_adlari)[soru_ids]
+
+    def guvenirlik(self):
+        """
+        Her yetkinlik icin Cronbach alfa ve madde bazinda duzeltilmis madde-toplam
+        korelasyonu ile 'madde silinirse alfa' degerini dondurur.
+        Sadece tum sorulari yanitlanmis satirlar (tam vaka) kullanilir.
+        """
+        yetkinlik_satirlari, madde_satirlari = [], []
+
+        for no, ad in enumerate(self.yetkinlik_adlari):
+            matris, sorular = self._yanit_matrisi(no)
+            tam = matris[~np.isnan(matris).any(axis=1)]
+            k = tam.shape[1]
+
+            if k < 2 or len(tam) < 2:
+                yetkinlik_satirlari.append({"yetkinlik": ad, "madde_sayisi": k, "n_tam": len(tam), "cronbach_alfa": np.nan})
+                continue
+
+            kov = np.cov(tam, rowvar=False)
+            madde_var = np.diag(kov)
+            toplam_var = kov.sum()
+            alfa = k / (k - 1) * (1 - madde_var.sum() / toplam_var) if toplam_var > 0 else np.nan
+
+            # Madde i ile (toplam - i) arasindaki kovaryans/varyans kovaryans matrisinden turetilir
+            satir_top = kov.sum(axis=1)
+            kalan_var = toplam_var - 2 * satir_top + madde_var
+            with np.errstate(invalid="ignore", divide="ignore"):
+                r_duz = (satir_top - madde_var) / np.sqrt(madde_var * kalan_var)
+                alfa_sil = (k - 1) / (k - 2) * (1 - (madde_var.sum() - madde_var) / kalan_var) if k > 2 else np.full(k, np.nan)
+
+            yetkinlik_satirlari.append({"yetkinlik": ad, "madde_sayisi": k, "n_tam": len(tam), "cronbach_alfa": round(alfa, 3)})
+            for i, soru in enumerate(sorular):
+                madde_satirlari.append({
+                    "yetkinlik": ad,
+                    "soru_id": soru,
+                    "madde_toplam_r": round(r_duz[i], 3),
+                    "silinirse_alfa": round(alfa_sil[i], 3),
+                })
+
+        return pd.DataFrame(yetkinlik_satirlari), pd.DataFrame(madde_satirlari, columns=["yetkinlik", "soru_id", "madde_toplam_r", "silinirse_alfa"])
+
+    # ============================================================
+    # BOLUM C: DEGERLENDIRICILER ARASI UYUM
+    # ============================================================
+
+    def degerlendirici_uyumu(self):
+        """
+        Her degerlendirici grubu icin ayni hedefi (calisan x yetkinlik x soru)
+        puanlayan degerlendiriciler arasindaki uyumu hesaplar:
+        - ICC(1): tek yonlu ANOVA, dengesiz grup boyutlari icin k0 duzeltmeli.
+        - rwg: 1 - gozlenen varyans / duzgun dagilim varyansi (hedef ortalamasi).
+        Tek degerlendiricili hedefler (orn. Yonetici) uyuma katilmaz.
+        """
+        m = self.gecerli
+        n_hedef = len(self.calisan_idleri) * len(self.yetkinlik_adlari) * len(self.soru_adlari)
+        hedef = (
+            (self.calisan_kod[m].astype(np.int64) * len(self.yetkinlik_adlari) + self.yetkinlik_kod[m])
+            * len(self.soru_adlari) + self.soru_kod[m]
+        )
+        grup = self.grup_kod[m].astype(np.int64)
+        hucre = grup * n_hedef + hedef
+        x = self.puan[m]
+
+        # Hucre (grup, hedef) bazinda n, toplam, kare toplam
+        hucre_kod, hucre_ids = pd.factorize(hucre)
+        n = np.bincount(hucre_kod).astype(float)
+        toplam = np.bincount(hucre_kod, weights=x)
+        kare = np.bincount(hucre_kod, weights=x * x)
+        hucre_grup = hucre_ids // n_hedef
+
+        # Uyum icin en az iki degerlendirici gerekir
+        coklu = n >= 2
+        n, toplam, kare, hucre_grup = n[coklu], toplam[coklu], kare[coklu], hucre_grup[coklu]
+        ort = toplam / n
+        ic_ks = kare - n * ort * ort
+        rwg = np.clip(1 - (ic_ks / (n - 1)) / self.BEKLENEN_VARYANS, 0, 1)
+
+        g_boyut = len(self.grup_adlari)
+        a = np.bincount(hucre_grup, minlength=g_boyut).astype(float)
+        N = np.bincount(hucre_grup, weights=n, minlength=g_boyut)
+        G_top = np.bincount(hucre_grup, weights=toplam, minlength=g_boyut)
+        n_kare = np.bincount(hucre_grup, weights=n * n, minlength=g_boyut)
+        ic_top = np.bincount(hucre_grup, weights=ic_ks, minlength=g_boyut)
+        rwg_top = np.bincount(hucre_grup, weights=rwg, minlength=g_boyut)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            genel_ort = G_top / N
+            arasi_ks = np.bincount(hucre_grup, weights=n * (ort - genel_ort[hucre_grup]) ** 2, minlength=g_boyut)
+            msb = arasi_ks / (a - 1)
+            msw = ic_top / (N - a)
+            k0 = (N - n_kare / N) / (a - 1)
+            icc1 = (msb - msw) / (msb + (k0 - 1) * msw)
+            rwg_ort = rwg_top / a
+
+        return pd.DataFrame({
+            "degerlendirici_grubu": np.asarray(self.grup_adlari),
+            "hedef_sayisi": a.astype(int),
+            "puan_sayisi": N.astype(int),
+            "ort_degerlendirici": np.round(k0, 2),
+            "icc1": np.round(icc1, 3),
+            "rwg_ort": np.round(rwg_ort, 3),
+        })
+
+    # ============================================================
+    # BOLUM D: RAPOR
+    # ============================================================
+
+    def madde_raporu(self):
+        """
+        Soru istatistiklerini guvenirlik sonuclariyla birlestirir ve her madde
+        icin 'ayiklama adayi' bayragi ile gerekcesini ekler.
+        """
+        soru = self.soru_istatistikleri()
+        yetkinlik, madde = self.guvenirlik()
+        rapor = soru.merge(madde, on=["yetkinlik", "soru_id"], how="left")
+        rapor = rapor.merge(yetkinlik[["yetkinlik", "cronbach_alfa"]], on="yetkinlik", how="left")
+        rapor.insert(2, "soru_metni", [self._soru_metni(y, s) for y, s in zip(rapor["yetkinlik"], rapor["soru_id"])])
+
+        dusuk_r = rapor["madde_toplam_r"] < self.MIN_MADDE_TOPLAM_R
+        alfa_artar = rapor["silinirse_alfa"] > rapor["cronbach_alfa"]
+        yeterli = rapor["n"] >= self.MIN_YANIT
+
+        gerekce = np.where(dusuk_r, "dusuk madde-toplam korelasyonu", "")
+        gerekce = np.where(alfa_artar, np.where(gerekce == "", "silinirse alfa artiyor", gerekce + "; silinirse alfa artiyor"), gerekce)
+        rapor["ayiklama_adayi"] = (dusuk_r | alfa_artar) & yeterli
+        rapor["gerekce"] = np.where(rapor["ayiklama_adayi"], gerekce, "")
+        return rapor
+
+    def rapor_yaz(self, cikti_klasoru=None):
+        """
+        Madde, yetkinlik ve degerlendirici uyumu tablolarini CSV olarak yazar.
+        Yazilan dosya yollarini dondurur.
+        """
+        if cikti_klasoru is None:
+            cikti_klasoru = self.kok_dizin / "output" / "analiz"
+        cikti_klasoru = Path(cikti_klasoru)
+        cikti_klasoru.mkdir(parents=True, exist_ok=True)
+
+        yollar = {
+            "madde": cikti_klasoru / "madde_analizi.csv",
+            "yetkinlik": cikti_klasoru / "yetkinlik_guvenirligi.csv",
+            "uyum": cikti_klasoru / "degerlendirici_uyumu.csv",
+        }
+        self.madde_raporu().to_csv(yollar["madde"], index=False, encoding="utf-8-sig")
+        self.guvenirlik()[0].to_csv(yollar["yetkinlik"], index=False, encoding="utf-8-sig")
+        self.degerlendirici_uyumu().to_csv(yollar["uyum"], index=False, encoding="utf-8-sig")
+        return yollar
+
+
+
+if __name__ == "__main__":
+    kok = Path(__file__).parent.parent
+    hesaplayici = YetkinlikSkorHesaplayici(kok / "data" / "input" / "faz0_sentetik_veri.csv")
+
+    analiz = MaddeAnalizi(hesaplayici)
+
+    print("--- Yetkinlik Guvenirligi ---")
+    print(analiz.guvenirlik()[0].to_string(index=False))
+
+    print("\n--- Degerlendirici Uyumu ---")
+    print(analiz.degerlendirici_uyumu().to_string(index=False))
+
+    print("\n--- Ayiklama Adayi Maddeler ---")
+    rapor = analiz.madde_raporu()
+    print(rapor[rapor["ayiklama_adayi"]][["yetkinlik", "soru_id", "madde_toplam_r", "gerekce"]].to_string(index=False))
+
+    print(f"\nRapor dosyalari: {analiz.rapor_yaz()}")
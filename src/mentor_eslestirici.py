@@ -0,0 +1,144 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.agrege_kup import AgregeKup
+from src.tavsiye_motoru import TavsiyeMotoru
+from src.yetkinlik_skor_hesaplayici import YetkinlikSkorHesaplayici
+
+
+class MentorEslestirici:
+    """
+    Modul Amaci:
+    1. Her calisani yetkinlik skor vektoru ile bir nokta olarak ele alir.
+    2. Bir yetkinlikte zayif olan calisan icin, o yetkinlikte guclu olan ve geri
+       kalan profili (diger yetkinlikler, rol, yaka tipi) en cok benzeyen k
+       meslektasi mentor olarak onerir.
+    3. Komsu aramasi rol bazli KD-agaclari (scipy.spatial.cKDTree) ile yapilir;
+       tum sirket icin eslestirme saniyeler icinde tamamlanir.
+    """
+
+    # Ayni yaka tipi zorunlu; farkli rol mesafeye sabit ceza olarak eklenir
+    ROL_CEZASI = 1.0
+
+    def __init__(self, kup, tavsiye_motoru=None):
+        self.kup = kup
+        self.motor = tavsiye_motoru if tavsiye_motoru is not None else TavsiyeMotoru()
+
+        self.calisan_idleri = np.asarray(kup.calisan_idleri)
+        self.yetkinlik_adlari = list(kup.yetkinlik_adlari)
+        self.skorlar = kup.calisan_matrisi()
+
+        # Mesafe icin eksik hucreleri yetkinlik ortalamasiyla doldur
+        with np.errstate(invalid="ignore"):
+            kolon_ort = np.nanmean(self.skorlar, axis=0) if len(self.skorlar) else np.array([])
+        self.vektorler = np.where(np.isnan(self.skorlar), np.nan_to_num(kolon_ort, nan=3.0), self.skorlar)
+
+        self.rol_kod = kup.calisan_rol_kod
+        self.yaka = kup.rol_yaka[self.rol_kod] if len(self.rol_kod) else np.array([], dtype=object)
+
+        # Calisan isimleri (ilk satir)
+        df = kup.hesaplayici.df
+        isimler = df.drop_duplicates("employee_id").set_index("employee_id")["employee_name"]
+        self.isimler = isimler.reindex(self.calisan_idleri).to_numpy()
+
+        kategori = np.vectorize(self.motor._kategoriBelirle, otypes=[object])
+        self.seviyeler = np.where(np.isnan(self.skorlar), None, kategori(np.nan_to_num(self.skorlar)))
+
+    def _en_yakinlar(self, sorgu, adaylar, yetkinlik_no, k):
+        """
+        'sorgu' calisan indeksleri icin 'adaylar' arasindan en yakin k indeksi
+        ve mesafeleri dondurur. Hedef yetkinlik mesafe hesabina katilmaz.
+        Adaylar rol bazinda KD-agaclarina bolunur; farkli roldeki adaylarin
+        mesafesine ROL_CEZASI eklenir ve sonuclar birlestirilip ilk k secilir.
+        """
+        from scipy.spatial import cKDTree
+
+        kolonlar = [i for i in range(self.vektorler.shape[1]) if i != yetkinlik_no]
+        Q = self.vektorler[np.ix_(sorgu, kolonlar)]
+        # Kendisi de aday olabilecegi icin bir fazla komsu istenir
+        k_ara = min(k + 1, len(adaylar))
+
+        tum_idx, tum_mesafe = [], []
+        for rol in np.unique(self.rol_kod[adaylar]):
+            rol_adaylari = adaylar[self.rol_kod[adaylar] == rol]
+            agac = cKDTree(self.vektorler[np.ix_(rol_adaylari, kolonlar)])
+            kk = min(k_ara, len(rol_adaylari))
+            mesafe, idx = agac.query(Q, k=kk)
+            mesafe, idx = mesafe.reshape(len(sorgu), kk), idx.reshape(len(sorgu), kk)
+            mesafe = mesafe + self.ROL_CEZASI * (self.rol_kod[sorgu] != rol)[:, None]
+            tum_idx.append(rol_adaylari[idx])
+            tum_mesafe.append(mesafe)
+
+        idx = np.concatenate(tum_idx, axis=1)
+        mesafe = np.concatenate(tum_mesafe, axis=1)
+        mesafe[idx == sorgu[:, None]] = np.inf
+
+        sira = np.argsort(mesafe, axis=1, kind="stable")[:, :min(k, idx.shape[1])]
+        return np.take_along_axis(idx, sira, axis=1), np.take_along_axis(mesafe, sira, axis=1)
+
+    def _tablo(self, sorgu, yetkinlik_no, k):
+        """
+        Sorgu calisanlari icin yaka tipi bazinda eslestirme yapar ve uzun tablo uretir.
+        """
+        parcalar = []
+        guclu = self.seviyeler[:, yetkinlik_no] == "strong"
+        for yaka in np.unique(self.yaka[sorgu]):
+            q = sorgu[self.yaka[sorgu] == yaka]
+            adaylar = np.flatnonzero(guclu & (self.yaka == yaka))
+            if len(adaylar) == 0:
+                continue
+            idx, mesafe = self._en_yakinlar(q, adaylar, yetkinlik_no, k)
+            gecerli = np.isfinite(mesafe)
+            satir, sira = np.nonzero(gecerli)
+            parcalar.append(pd.DataFrame({
+                "employee_id": self.calisan_idleri[q[satir]],
+                "employee_name": self.isimler[q[satir]],
+                "yetkinlik": self.yetkinlik_adlari[yetkinlik_no],
+                "skor": self.skorlar[q[satir], yetkinlik_no].round(2),
+                "sira": sira + 1,
+                "mentor_id": self.calisan_idleri[idx[gecerli]],
+                "mentor_name": self.isimler[idx[gecerli]],
+                "mentor_skor": self.skorlar[idx[gecerli], yetkinlik_no].round(2),
+                "mesafe": mesafe[gecerli].round(3),
+            }))
+        return parcalar
+
+    def eslestir(self, k=3):
+        """
+        Tum sirket icin: her yetkinlikte 'weak' seviyedeki her calisana k mentor.
+        """
+        parcalar = []
+        for no in range(len(self.yetkinlik_adlari)):
+            zayif = np.flatnonzero(self.seviyeler[:, no] == "weak")
+            if len(zayif):
+                parcalar.extend(self._tablo(zayif, no, k))
+        kolonlar = ["employee_id", "employee_name", "yetkinlik", "skor", "sira", "mentor_id", "mentor_name", "mentor_skor", "mesafe"]
+        return pd.concat(parcalar, ignore_index=True) if parcalar else pd.DataFrame(columns=kolonlar)
+
+    def mentor_oner(self, calisan_id, yetkinlik, k=3):
+        """
+        Tek calisan ve yetkinlik icin mentor listesi (dashboard icin).
+        Calisanin o yetkinlikteki seviyesinden bagimsiz calisir.
+        """
+        indeks = self.kup._indeks["calisan"]
+        if calisan_id not in indeks or yetkinlik not in self.yetkinlik_adlari:
+            return []
+        parcalar = self._tablo(np.array([indeks[calisan_id]]), self.yetkinlik_adlari.index(yetkinlik), k)
+        if not parcalar:
+            return []
+        return parcalar[0][["mentor_id", "mentor_name", "mentor_skor", "mesafe"]].to_dict("records")
+
+
+if __name__ == "__main__":
+    kok = Path(__file__).parent.parent
+    hesaplayici = YetkinlikSkorHesaplayici(kok / "data" / "input" / "faz0_sentetik_veri.csv")
+    eslestirici = MentorEslestirici(AgregeKup(hesaplayici))
+
+    print("--- Sirket Geneli Mentor Eslestirmeleri ---")
+    tablo = eslestirici.eslestir(k=2)
+    if tablo.empty:
+        print("Zayif yetkinlik icin uygun mentor bulunamadi.")
+    else:
+        print(tablo.to_string(index=False))
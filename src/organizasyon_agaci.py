@@ -0,0 +1,291 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.agrege_kup import AgregeKup
+from src.tavsiye_motoru import TavsiyeMotoru
+from src.yetkinlik_skor_hesaplayici import YetkinlikSkorHesaplayici
+
+
+class OrganizasyonAgaci:
+    """
+    Modul Amaci:
+    1. 'Yönetici' / '1.Yönetici' degerlendirme satirlarindan kimin kime bagli
+       oldugunu cikarir (evaluator_name -> employee_name). '2.Yönetici' satirlari,
+       dogrudan yoneticinin kendi ust yoneticisi bilinmiyorsa onu tamamlar.
+    2. Her alt agac (yonetici + tum altlari) icin yetkinlik bazinda puan
+       TOPLAMI/ADEDI, seviye dagilimi (zayif / orta / guclu kisi sayisi) ve kisi
+       sayisini tek bir asagidan-yukariya (post-order) geciste onceden hesaplar.
+    3. Ekip ozeti ve ekip isi haritasi bu rollup'lardan okunur; binlerce kisilik
+       bir ekibin gorunumu tek bir satir okumasidir, yeniden toplama yapilmaz.
+    """
+
+    SEVIYELER = ("weak", "medium", "strong")
+
+    def __init__(self, kup, tavsiye_motoru=None):
+        self.kup = kup
+        self.motor = tavsiye_motoru if tavsiye_motoru is not None else TavsiyeMotoru()
+        self.yetkinlik_adlari = list(kup.yetkinlik_adlari)
+
+        # --- 1. DUGUMLER: once calisanlar, sonra calisan olmayan yoneticiler ---
+        df = kup.hesaplayici.df
+        calisan_idleri = np.asarray(kup.calisan_idleri)
+        isimler = df.drop_duplicates("employee_id").set_index("employee_id")["employee_name"]
+        calisan_isimleri = isimler.reindex(calisan_idleri).to_numpy()
+
+        baglar = self._yonetici_baglari(df)
+        ikinci = self._en_sik(self._yonetici_satirlari(df, "yonetici2"))
+        isim_indeks = pd.Series(np.arange(len(calisan_idleri)), index=calisan_isimleri)
+        isim_indeks = isim_indeks[~isim_indeks.index.duplicated()]
+        yonetici_adlari = pd.unique(pd.concat([baglar["yonetici"], ikinci["evaluator_name"]]))
+        dis_yoneticiler = yonetici_adlari[~pd.Index(yonetici_adlari).isin(isim_indeks.index)]
+        isim_indeks = pd.concat([
+            isim_indeks,
+            pd.Series(np.arange(len(dis_yoneticiler)) + len(calisan_idleri), index=dis_yoneticiler, dtype=np.int64),
+        ])
+
+        self.calisan_sayisi = len(calisan_idleri)
+        self.dugum_adlari = np.concatenate([calisan_isimleri, dis_yoneticiler]).astype(object)
+        self.dugum_idleri = np.concatenate([calisan_idleri, np.full(len(dis_yoneticiler), None)]).astype(object)
+        self._ad_indeks = dict(isim_indeks.items())
+        dugum_sayisi = len(self.dugum_adlari)
+
+        # --- 2. EBEVEYN DIZISI ---
+        self.ebeveyn = np.full(dugum_sayisi, -1, dtype=np.int64)
+        cocuk = baglar["calisan_no"].to_numpy()
+        ust = isim_indeks.reindex(baglar["yonetici"]).to_numpy()
+        self.ebeveyn[cocuk] = ust
+        self.ebeveyn[self.ebeveyn == np.arange(dugum_sayisi)] = -1
+        self._ust_yonetici_tamamla(ikinci, calisan_idleri, isim_indeks)
+        self.derinlik = self._derinlik_hesapla()
+
+        # --- 3. KENDI KATKILARI (calisan bazinda) ---
+        yetkinlik_sayisi = len(self.yetkinlik_adlari)
+        self.alt_toplam = np.zeros((dugum_sayisi, yetkinlik_sayisi))
+        self.alt_adet = np.zeros((dugum_sayisi, yetkinlik_sayisi), dtype=np.int64)
+        self.alt_dagilim = np.zeros((dugum_sayisi, yetkinlik_sayisi, len(self.SEVIYELER)), dtype=np.int64)
+        self.alt_kisi = np.zeros(dugum_sayisi, dtype=np.int64)
+
+        self.alt_toplam[:self.calisan_sayisi] = kup.toplam.sum(axis=(2, 3))
+        self.alt_adet[:self.calisan_sayisi] = kup.adet.sum(axis=(2, 3))
+        skorlar = kup.calisan_matrisi()
+        kategori = np.vectorize(self.motor._kategoriBelirle, otypes=[object])
+        seviyeler = np.where(np.isnan(skorlar), None, kategori(np.nan_to_num(skorlar)))
+        for s, seviye in enumerate(self.SEVIYELER):
+            self.alt_dagilim[:self.calisan_sayisi, :, s] = seviyeler == seviye
+        self.alt_kisi[:self.calisan_sayisi] = 1
+
+        # Yoneticinin kendi puanlari ekip gorunumune dahil edilmez (alt agac - kendisi)
+        self.kendi_toplam = self.alt_toplam.copy()
+        self.kendi_adet = self.alt_adet.copy()
+        self.kendi_dagilim = self.alt_dagilim.copy()
+
+        # --- 4. POST-ORDER ROLLUP (en derin seviyeden koke) ---
+        # Ayni derinlikteki dugumler birbirinden bagimsizdir; her seviye tek
+        # vektorel toplama ile ebeveynine eklenir.
+        for d in range(int(self.derinlik.max(initial=0)), 0, -1):
+            dugumler = np.flatnonzero(self.derinlik == d)
+            ust = self.ebeveyn[dugumler]
+            np.add.at(self.alt_toplam, ust, self.alt_toplam[dugumler])
+            np.add.at(self.alt_adet, ust, self.alt_adet[dugumler])
+            np.add.at(self.alt_dagilim, ust, self.alt_dagilim[dugumler])
+            np.add.at(self.alt_kisi, ust, self.alt_kisi[dugumler])
+
+    # ============================================================
+    # BOLUM A: AGACIN KURULMASI
+    # ============================================================
+
+    def _yonetici_satirlari(self, df, anahtar):
+        """
+        Belirtilen kural anahtarina (yonetici1 / yonetici2) dusen satirlardan
+        (employee_id, evaluator_name) ciftlerini ve tekrar sayilarini dondurur.
+        """
+        gruplar = pd.unique(df["evaluator_group"].dropna())
+        secilen = [g for g in gruplar if self.kup.hesaplayici.grup_anahtari_bul(g) == anahtar]
+        satirlar = df.loc[df["evaluator_group"].isin(secilen), ["employee_id", "evaluator_name"]].dropna()
+        return satirlar.groupby(["employee_id", "evaluator_name"], sort=False).size().reset_index(name="adet")
+
+    @staticmethod
+    def _en_sik(ciftler):
+        """
+        Calisan basina en cok satirda gecen yoneticiyi secer (esitlikte alfabetik ilk).
+        """
+        ciftler = ciftler.sort_values(["adet", "evaluator_name"], ascending=[False, True], kind="stable")
+        return ciftler.drop_duplicates("employee_id")
+
+    def _yonetici_baglari(self, df):
+        """
+        Dogrudan yonetici baglarini (calisan_no, yonetici adi) tablosu olarak dondurur.
+        """
+        dogrudan = self._en_sik(self._yonetici_satirlari(df, "yonetici1"))
+        calisan_no = pd.Series(np.arange(len(self.kup.calisan_idleri)), index=self.kup.calisan_idleri)
+        return pd.DataFrame({
+            "calisan_no": calisan_no.reindex(dogrudan["employee_id"]).to_numpy(),
+            "yonetici": dogrudan["evaluator_name"].to_numpy(),
+        }).dropna().astype({"calisan_no": np.int64})
+
+    def _ust_yonetici_tamamla(self, ikinci, calisan_idleri, isim_indeks):
+        """
+        '2.Yönetici' satirlari: calisanin dogrudan yoneticisinin ebeveyni yoksa
+        2. yoneticiyi onun ebeveyni yapar.
+        """
+        if ikinci.empty:
+            return
+        calisan_no = pd.Series(np.arange(len(calisan_idleri)), index=calisan_idleri)
+        cocuk = calisan_no.reindex(ikinci["employee_id"]).to_numpy()
+        ust = isim_indeks.reindex(ikinci["evaluator_name"]).to_numpy()
+        gecerli = ~(np.isnan(cocuk) | np.isnan(ust))
+        cocuk, ust = cocuk[gecerli].astype(np.int64), ust[gecerli].astype(np.int64)
+
+        yonetici = self.ebeveyn[cocuk]
+        uygun = (yonetici >= 0) & (yonetici != ust)
+        yonetici, ust = yonetici[uygun], ust[uygun]
+        # Ayni yonetici icin birden fazla aday varsa ilki (en sik gecen) yeter
+        yonetici, ilk = np.unique(yonetici, return_index=True)
+        ust = ust[ilk]
+        bos = self.ebeveyn[yonetici] < 0
+        self.ebeveyn[yonetici[bos]] = ust[bos]
+
+    def _cocuklar(self, dugumler):
+        """
+        Verilen dugumlerin tum dogrudan cocuklarini tek dizi olarak dondurur.
+        """
+        baslar = self._cocuk_baslari[dugumler]
+        uzunluk = self._cocuk_baslari[dugumler + 1] - baslar
+        if uzunluk.sum() == 0:
+            return np.array([], dtype=np.int64)
+        konum = np.repeat(baslar - np.cumsum(np.r_[0, uzunluk[:-1]]), uzunluk) + np.arange(uzunluk.sum())
+        return self._cocuk_sirasi[konum]
+
+    def _derinlik_hesapla(self):
+        """
+        Koklerden genislik-oncelikli gezerek her dugumun derinligini bulur.
+        Hatali veriden dogan donguler, donguden bir dugum kok yapilarak kirilir.
+        """
+        dugum_sayisi = len(self.ebeveyn)
+        derinlik = np.full(dugum_sayisi, -1, dtype=np.int64)
+        while True:
+            sirali = np.argsort(self.ebeveyn, kind="stable")
+            sirali = sirali[self.ebeveyn[sirali] >= 0]
+            self._cocuk_sirasi = sirali
+            self._cocuk_baslari = np.concatenate([[0], np.cumsum(np.bincount(self.ebeveyn[sirali], minlength=dugum_sayisi))])
+
+            seviye = np.flatnonzero((self.ebeveyn < 0) & (derinlik < 0))
+            d = 0
+            while len(seviye):
+                derinlik[seviye] = d
+                seviye = self._cocuklar(seviye)
+                d += 1
+            ulasilmayan = np.flatnonzero(derinlik < 0)
+            if len(ulasilmayan) == 0:
+                return derinlik
+            print(f"UYARI: Yonetici iliskilerinde dongu var, '{self.dugum_adlari[ulasilmayan[0]]}' kok yapildi.")
+            self.ebeveyn[ulasilmayan[0]] = -1
+
+    # ============================================================
+    # BOLUM B: ROLLUP OKUMA
+    # ============================================================
+
+    def dugum_bul(self, ad):
+        """
+        Isim (employee_name / evaluator_name) veya employee_id ile dugum indeksini bulur.
+        """
+        if ad in self._ad_indeks:
+            return self._ad_indeks[ad]
+        eslesen = np.flatnonzero(self.dugum_idleri[:self.calisan_sayisi] == ad)
+        return int(eslesen[0]) if len(eslesen) else None
+
+    def yoneticiler(self):
+        """
+        Altinda en az bir kisi olan yoneticileri, ekip buyuklugune gore dondurur.
+        """
+        cocuk_sayisi = np.diff(self._cocuk_baslari)
+        secilen = np.flatnonzero(cocuk_sayisi > 0)
+        ekip = self.alt_kisi[secilen] - (secilen < self.calisan_sayisi)
+        sira = np.argsort(-ekip, kind="stable")
+        return pd.DataFrame({
+            "yonetici": self.dugum_adlari[secilen[sira]],
+            "dogrudan_bagli": cocuk_sayisi[secilen[sira]],
+            "ekip_buyuklugu": ekip[sira],
+        })
+
+    def ekip_ozeti(self, yonetici):
+        """
+        Yoneticinin tum alt agacinin yetkinlik bazinda ortalamasi (toplam/adet),
+        seviye dagilimi ve zayif kisi sayisi. Yoneticinin kendi puanlari ekibe dahil
+        edilmez; sonuc dogrudan rollup satirindan okunur.
+        """
+        dugum = self.dugum_bul(yonetici)
+        if dugum is None:
+            return pd.DataFrame(columns=["yetkinlik", "ortalama", "zayif", "orta", "guclu", "kisi_sayisi"])
+
+        toplam = self.alt_toplam[dugum] - self.kendi_toplam[dugum]
+        adet = self.alt_adet[dugum] - self.kendi_adet[dugum]
+        dagilim = self.alt_dagilim[dugum] - self.kendi_dagilim[dugum]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            ortalama = toplam / adet
+        return pd.DataFrame({
+            "yetkinlik": self.yetkinlik_adlari,
+            "ortalama": np.round(ortalama, 2),
+            "zayif": dagilim[:, 0],
+            "orta": dagilim[:, 1],
+            "guclu": dagilim[:, 2],
+            "kisi_sayisi": dagilim.sum(axis=1),
+        })
+
+    def isi_haritasi(self, yonetici):
+        """
+        Satirlar: yoneticiye dogrudan bagli kisiler (her biri kendi alt agaciyla),
+        kolonlar: yetkinlikler, degerler: alt agac ortalamasi.
+        Ek olarak her satirin kisi sayisi ve zayif (kisi x yetkinlik) hucre sayisi dondurulur.
+        """
+        dugum = self.dugum_bul(yonetici)
+        if dugum is None:
+            return pd.DataFrame(columns=self.yetkinlik_adlari), pd.DataFrame(columns=["kisi", "zayif_alan"])
+
+        cocuklar = self._cocuklar(np.array([dugum]))
+        cocuklar = cocuklar[np.argsort(-self.alt_kisi[cocuklar], kind="stable")]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            ortalama = self.alt_toplam[cocuklar] / self.alt_adet[cocuklar]
+        etiket = [
+            f"{ad} (+{n - 1})" if n > 1 else ad
+            for ad, n in zip(self.dugum_adlari[cocuklar], self.alt_kisi[cocuklar])
+        ]
+        harita = pd.DataFrame(np.round(ortalama, 2), index=etiket, columns=self.yetkinlik_adlari)
+        bilgi = pd.DataFrame({
+            "kisi": self.alt_kisi[cocuklar],
+            "zayif_alan": self.alt_dagilim[cocuklar, :, 0].sum(axis=1),
+        }, index=etiket)
+        return harita, bilgi
+
+    def ekip_tablosu(self):
+        """
+        Tum yoneticiler icin ekip ozeti (toplu is raporu): yonetici x yetkinlik.
+        """
+        parcalar = []
+        for satir in self.yoneticiler().itertuples(index=False):
+            ozet = self.ekip_ozeti(satir.yonetici)
+            ozet.insert(0, "yonetici", satir.yonetici)
+            ozet.insert(1, "ekip_buyuklugu", satir.ekip_buyuklugu)
+            parcalar.append(ozet)
+        if not parcalar:
+            return pd.DataFrame(columns=["yonetici", "ekip_buyuklugu", "yetkinlik", "ortalama", "zayif", "orta", "guclu", "kisi_sayisi"])
+        return pd.concat(parcalar, ignore_index=True)
+
+
+if __name__ == "__main__":
+    kok = Path(__file__).parent.parent
+    hesaplayici = YetkinlikSkorHesaplayici(kok / "data" / "input" / "faz0_sentetik_veri.csv")
+    agac = OrganizasyonAgaci(AgregeKup(hesaplayici))
+
+    print("--- Yoneticiler ---")
+    print(agac.yoneticiler().to_string(index=False))
+
+    ilk = agac.yoneticiler()["yonetici"].iloc[0]
+    print(f"\n--- Ekip Ozeti: {ilk} ---")
+    print(agac.ekip_ozeti(ilk).to_string(index=False))
+
+    harita, bilgi = agac.isi_haritasi(ilk)
+    print(f"\n--- Ekip Isi Haritasi: {ilk} ---")
+    print(harita.join(bilgi).to_string())
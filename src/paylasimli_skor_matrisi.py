@@ -0,0 +1,278 @@
+import os
+import struct
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+
+class AnlikGoruntu(NamedTuple):
+    """
+    Tek bir yayinin baslik ve dizi gorunumleri (esleme, dizilerin .base'i ile canli kalir).
+    """
+    baslik: dict
+    matris: np.ndarray
+    idler: np.ndarray
+    adlar: np.ndarray
+    roller: np.ndarray
+    yetkinlik_adlari: tuple
+
+
+class PaylasimliSkorMatrisi:
+    """
+    Modul Amaci:
+    1. Yukleyici surec, calisan x yetkinlik skor matrisini ve calisan rehberini
+       (id, isim, rol) tek bir bellek-eslemeli (mmap) dosyaya yazar.
+    2. Dosyanin basinda surumlu bir baslik bulunur (bicim surumu + veri surumu).
+       Yeni yayin gecici dosyaya yazilip atomik olarak yer degistirilir; bagli
+       okuyucular eski kopyayi kullanmaya devam eder, yenile() ile gecis yapar.
+    3. Panel ve rapor surecleri dosyaya salt-okunur ve kopyasiz baglanir. Sayfalar
+       isletim sistemi tarafindan tum sureclerce paylasildigi icin surec sayisi
+       arttikca bellek kullanimi artmaz.
+
+    Not: multiprocessing.shared_memory yerine mmap dosyasi kullanilir; Python
+    3.11'de baglanan her surec segmenti kapanista silmeye calisir (resource
+    tracker) ve tampon salt-okunur eslenemez. Ayni etki icin dosya /dev/shm
+    altina konabilir.
+    """
+
+    SIHIRLI = b"YSKMATRS"
+    BICIM_SURUMU = 1
+    # sihirli, bicim_surumu, veri_surumu, yayin_zamani, genel_ortalama,
+    # calisan_sayisi, yetkinlik_sayisi, id_genislik, ad_genislik, rol_genislik,
+    # yetkinlik_genislik, id_sayisal
+    BASLIK = struct.Struct("<8sIQddQIIIIIB")
+    BASLIK_BOYUTU = 128
+
+    def __init__(self, yol=None):
+        self.yol = Path(yol or self.varsayilan_yol())
+        self._baglan()
+
+    @classmethod
+    def varsayilan_yol(cls):
+        return Path(__file__).parent.parent / "output" / "paylasim" / "skor_matrisi.bin"
+
+    # ============================================================
+    # BOLUM A: YAYINLAMA (yukleyici surec)
+    # ============================================================
+
+    @staticmethod
+    def _sabit_genislik(degerler):
+        """
+        Metinleri UTF-8 sabit genislikli bayt dizisine ('S<n>') cevirir.
+        """
+        kodlanmis = [str(d).encode("utf-8") for d in degerler]
+        genislik = max((len(k) for k in kodlanmis), default=1) or 1
+        return np.array(kodlanmis, dtype=f"S{genislik}"), genislik
+
+    @classmethod
+    def _bolumler(cls, baslik):
+        """
+        Baslik alanlarindan bolum (ad, dtype, eleman sayisi, konum) listesini cikarir.
+        Her bolum 8 bayta hizalanir.
+        """
+        n, m = baslik["calisan_sayisi"], baslik["yetkinlik_sayisi"]
+        tanimlar = [
+            ("skorlar", np.dtype("<f8"), n * m),
+            ("idler", np.dtype(f"S{baslik['id_genislik']}"), n),
+            ("adlar", np.dtype(f"S{baslik['ad_genislik']}"), n),
+            ("roller", np.dtype(f"S{baslik['rol_genislik']}"), n),
+            ("yetkinlikler", np.dtype(f"S{baslik['yetkinlik_genislik']}"), m),
+        ]
+        bolumler, konum = [], cls.BASLIK_BOYUTU
+        for ad, dtype, adet in tanimlar:
+            bolumler.append((ad, dtype, adet, konum))
+            konum += -(-dtype.itemsize * adet // 8) * 8
+        return bolumler, konum
+
+    @classmethod
+    def _baslik_oku(cls, tampon):
+        alanlar = cls.BASLIK.unpack_from(tampon, 0)
+        if alanlar[0] != cls.SIHIRLI:
+            raise ValueError("Paylasimli skor matrisi dosyasi taninmadi (sihirli bayt uyusmuyor).")
+        if alanlar[1] != cls.BICIM_SURUMU:
+            raise ValueError(f"Paylasimli skor matrisi bicim surumu desteklenmiyor: {alanlar[1]}")
+        adlar = ("veri_surumu", "yayin_zamani", "genel_ortalama", "calisan_sayisi", "yetkinlik_sayisi",
+                 "id_genislik", "ad_genislik", "rol_genislik", "yetkinlik_genislik", "id_sayisal")
+        return dict(zip(adlar, alanlar[2:]))
+
+    @classmethod
+    def _disk_surumu(cls, yol):
+        """
+        Diskteki dosyanin veri surumu; dosya yoksa veya gecersizse 0.
+        """
+        try:
+            with open(yol, "rb") as f:
+                return cls._baslik_oku(f.read(cls.BASLIK.size))["veri_surumu"]
+        except (OSError, ValueError, struct.error):
+            return 0
+
+    @classmethod
+    def yayinla(cls, hesaplayici, yol=None):
+        """
+        Hesaplayicinin tum calisan skorlarini ve calisan rehberini dosyaya yazar.
+        Veri surumu her yayinda bir artar. Yazilan dosyanin yolunu dondurur.
+        """
+        yol = Path(yol or cls.varsayilan_yol())
+        yol.parent.mkdir(parents=True, exist_ok=True)
+
+        calisan_idleri, yetkinlik_adlari, matris = hesaplayici.hesapla_toplu()
+        rehber = hesaplayici.df.drop_duplicates("employee_id").set_index("employee_id")
+        idler, id_genislik = cls._sabit_genislik(calisan_idleri)
+        # Okuyucu ikili arama yapar: satirlar bayt sirasina gore dizilir
+        sira = np.argsort(idler, kind="stable")
+        idler, matris = idler[sira], np.ascontiguousarray(matris[sira], dtype="<f8")
+        adlar, ad_genislik = cls._sabit_genislik(rehber["employee_name"].reindex(calisan_idleri[sira]))
+        roller, rol_genislik = cls._sabit_genislik(rehber["role"].reindex(calisan_idleri[sira]))
+        yetkinlikler, yetkinlik_genislik = cls._sabit_genislik(yetkinlik_adlari)
+
+        baslik = {
+            "veri_surumu": cls._disk_surumu(yol) + 1,
+            "yayin_zamani": time.time(),
+            "genel_ortalama": float(hesaplayici.genel_ortalama()),
+            "calisan_sayisi": len(idler),
+            "yetkinlik_sayisi": len(yetkinlikler),
+            "id_genislik": id_genislik,
+            "ad_genislik": ad_genislik,
+            "rol_genislik": rol_genislik,
+            "yetkinlik_genislik": yetkinlik_genislik,
+            "id_sayisal": int(np.issubdtype(np.asarray(calisan_idleri).dtype, np.integer)),
+        }
+        bolumler, toplam_boyut = cls._bolumler(baslik)
+        veriler = {"skorlar": matris, "idler": idler, "adlar": adlar, "roller": roller, "yetkinlikler": yetkinlikler}
+
+        gecici = yol.with_name(f"{yol.name}.{os.getpid()}.tmp")
+        with open(gecici, "wb") as f:
+            f.truncate(toplam_boyut)
+            f.write(cls.BASLIK.pack(cls.SIHIRLI, cls.BICIM_SURUMU, *baslik.values()))
+            for ad, dtype, adet, konum in bolumler:
+                f.seek(konum)
+                f.write(np.ascontiguousarray(veriler[ad], dtype=dtype).tobytes())
+        # Atomik degisim: bagli okuyucularin eslemesi eski dosyada gecerli kalir
+        os.replace(gecici, yol)
+        return yol
+
+    # ============================================================
+    # BOLUM B: BAGLANMA VE OKUMA (panel / isci surecleri)
+    # ============================================================
+
+    def _baglan(self):
+        """
+        Dosyayi salt-okunur esler; tum diziler bu esleme uzerinde kopyasiz gorunumlerdir.
+        Baslik ve gorunumler tek bir degismez anlik goruntude toplanir ve tek atamayla
+        yerlestirilir; ayni nesneyi paylasan oturumlar yenile() sirasinda eski ve yeni
+        yayinin dizilerini karistiramaz.
+        """
+        esleme = np.memmap(self.yol, dtype=np.uint8, mode="r")
+        baslik = self._baslik_oku(esleme[:self.BASLIK.size].tobytes())
+        bolumler, _ = self._bolumler(baslik)
+        diziler = {
+            ad: esleme[konum:konum + dtype.itemsize * adet].view(dtype)
+            for ad, dtype, adet, konum in bolumler
+        }
+        self._goruntu = AnlikGoruntu(
+            baslik=baslik,
+            matris=diziler["skorlar"].reshape(baslik["calisan_sayisi"], baslik["yetkinlik_sayisi"]),
+            idler=diziler["idler"],
+            adlar=diziler["adlar"],
+            roller=diziler["roller"],
+            yetkinlik_adlari=tuple(y.decode("utf-8") for y in diziler["yetkinlikler"]),
+        )
+
+    # Okuma metotlari anlik goruntuyu bir kez alir ve sadece onu kullanir
+    @property
+    def baslik(self):
+        return self._goruntu.baslik
+
+    @property
+    def matris(self):
+        return self._goruntu.matris
+
+    @property
+    def yetkinlik_adlari(self):
+        return list(self._goruntu.yetkinlik_adlari)
+
+    @property
+    def veri_surumu(self):
+        return self._goruntu.baslik["veri_surumu"]
+
+    @property
+    def genel_ortalama(self):
+        return self._goruntu.baslik["genel_ortalama"]
+
+    def yenile(self):
+        """
+        Diskte daha yeni bir yayin varsa ona yeniden baglanir (sadece basligi okur).
+        Yeniden baglanildiysa True doner.
+        """
+        if self._disk_surumu(self.yol) == self.veri_surumu:
+            return False
+        self._baglan()
+        return True
+
+    @staticmethod
+    def _satir(goruntu, calisan_id):
+        anahtar = str(calisan_id).encode("utf-8")
+        satir = int(np.searchsorted(goruntu.idler, anahtar))
+        if satir < len(goruntu.idler) and goruntu.idler[satir] == anahtar:
+            return satir
+        return None
+
+    def satir_bul(self, calisan_id):
+        """
+        Calisan id'sinin matris satirini ikili arama ile bulur; yoksa None.
+        """
+        return self._satir(self._goruntu, calisan_id)
+
+    def skorlar(self, calisan_id):
+        """
+        YetkinlikSkorHesaplayici.hesapla() ile ayni bicimde {yetkinlik: skor} dondurur.
+        """
+        goruntu = self._goruntu
+        satir = self._satir(goruntu, calisan_id)
+        if satir is None:
+            return {}
+        # np.float64 yuvarlamasi: hesapla() ile birebir ayni sonuc
+        return {
+            ad: round(puan, 2)
+            for ad, puan in zip(goruntu.yetkinlik_adlari, goruntu.matris[satir])
+            if not np.isnan(puan)
+        }
+
+    def calisan_adlari(self):
+        return [a.decode("utf-8") for a in np.unique(self._goruntu.adlar)]
+
+    def calisan_bilgisi(self, isim):
+        """
+        Isme gore {"employee_id", "role"} dondurur; bulunamazsa None.
+        """
+        goruntu = self._goruntu
+        eslesen = np.flatnonzero(goruntu.adlar == str(isim).encode("utf-8"))
+        if len(eslesen) == 0:
+            return None
+        satir = eslesen[0]
+        ham_id = goruntu.idler[satir].decode("utf-8")
+        return {
+            "employee_id": int(ham_id) if goruntu.baslik["id_sayisal"] else ham_id,
+            "role": goruntu.roller[satir].decode("utf-8"),
+        }
+
+if __name__ == "__main__":
+    from src.yetkinlik_skor_hesaplayici import YetkinlikSkorHesaplayici
+
+    kok = Path(__file__).parent.parent
+    yukleyici = YetkinlikSkorHesaplayici(kok / "data" / "input" / "faz0_sentetik_veri.csv")
+    yol = PaylasimliSkorMatrisi.yayinla(yukleyici)
+
+    matris = PaylasimliSkorMatrisi(yol)
+    print(f"Yayinlandi: {yol} (veri surumu {matris.veri_surumu}, "
+          f"{matris.baslik['calisan_sayisi']} calisan x {matris.baslik['yetkinlik_sayisi']} yetkinlik)")
+
+    # Okuyucu taraf: ham tablo yuklenmeden ayni skorlar
+    okuyucu = YetkinlikSkorHesaplayici(None, paylasimli_matris=matris)
+    ornek_id = yukleyici.df.iloc[0]["employee_id"]
+    print(f"Calisan ID: {ornek_id}")
+    print(f"Paylasimli : {okuyucu.hesapla(ornek_id)}")
+    print(f"Yerel      : {yukleyici.hesapla(ornek_id)}")
+    print(f"Salt-okunur: {not matris.matris.flags.writeable}")
@@ -0,0 +1,100 @@
+import os
+import time
+from pathlib import Path
+
+from src.yetkinlik_skor_hesaplayici import YetkinlikSkorHesaplayici
+
+
+class TopluIslem:
+    """
+    Modul Amaci: Gece calisan toplu (batch) isi.
+    Degerlendirme verisini bir kez yukler ve dogrular (hatali satirlar karantinaya
+    alinir); ardindan madde analizi, mentor eslestirme, ekip ozetleri ve kohort
+    planlamasini sirayla calistirip sonuclari 'output/analiz' altina yazar.
+    """
+
+    def __init__(self, veri_yolu=None, etkinlik_yolu=None, cikti_klasoru=None, karantina=True, paylasim_yolu=None):
+        self.kok_dizin = Path(__file__).parent.parent
+        self.veri_yolu = veri_yolu or self.kok_dizin / "data" / "input" / "faz0_sentetik_veri.csv"
+        self.etkinlik_yolu = etkinlik_yolu or self.kok_dizin / "data" / "input" / "etkinlik_listesi.csv"
+        self.cikti_klasoru = Path(cikti_klasoru or self.kok_dizin / "output" / "analiz")
+        self.karantina = karantina
+        # Panellerin bagli oldugu skor matrisi; None ise YETKINLIK_PAYLASIM_YOLU
+        # ortam degiskeni, o da yoksa PaylasimliSkorMatrisi.varsayilan_yol()
+        self.paylasim_yolu = paylasim_yolu or os.environ.get("YETKINLIK_PAYLASIM_YOLU")
+        self.sureler = {}
+
+    def _adim(self, ad, fonksiyon):
+        """
+        Bir adimi calistirir ve suresini kaydeder.
+        """
+        baslangic = time.perf_counter()
+        sonuc = fonksiyon()
+        self.sureler[ad] = round(time.perf_counter() - baslangic, 3)
+        print(f"[{ad}] {self.sureler[ad]:.2f} sn")
+        return sonuc
+
+    def calistir(self):
+        """
+        Tum adimlari calistirir; yazilan dosya yollarini dondurur.
+        """
+        # Analiz modulleri (numpy/pandas/scipy) sadece is gercekten calisinca yuklenir
+        from src.agrege_kup import AgregeKup
+        from src.etkinlik_kaziyici import EtkinlikKaziyici
+        from src.kohort_planlayici import KohortPlanlayici
+        from src.madde_analizi import MaddeAnalizi
+        from src.mentor_eslestirici import MentorEslestirici
+        from src.organizasyon_agaci import OrganizasyonAgaci
+        from src.paylasimli_skor_matrisi import PaylasimliSkorMatrisi
+        from src.veri_dogrulayici import VeriDogrulayici
+
+        self.cikti_klasoru.mkdir(parents=True, exist_ok=True)
+        yazilanlar = {}
+
+        hesaplayici = self._adim("yukleme", lambda: YetkinlikSkorHesaplayici(str(self.veri_yolu)))
+        if hesaplayici.df.empty:
+            print("UYARI: Degerlendirme verisi bos, toplu islem durduruldu.")
+            return yazilanlar
+
+        # Tam calismaya girmeden once veri kalitesi kontrolu
+        dogrulayici = VeriDogrulayici(hesaplayici)
+        rapor = self._adim("dogrulama", dogrulayici.dogrula)
+        karantina_df = dogrulayici.karantinaya_al()[1] if self.karantina and not rapor["kritik"] else None
+        yazilanlar.update(dogrulayici.rapor_yaz(self.cikti_klasoru, karantina_df))
+        if rapor["kritik"]:
+            print("UYARI: Veri dogrulamasi kritik hata verdi, toplu islem durduruldu.")
+            return yazilanlar
+        if rapor["karantina_sayisi"]:
+            print(f"Bilgi: {rapor['karantina_sayisi']} satir karantinaya alindi.")
+
+        # Panel ve isci surecleri dogrulanmis skorlara paylasimli matristen baglanir
+        yazilanlar["skor_matrisi"] = self._adim("skor_matrisi_yayini", lambda: PaylasimliSkorMatrisi.yayinla(hesaplayici, self.paylasim_yolu))
+
+        kup = self._adim("kup", lambda: AgregeKup(hesaplayici))
+
+        yazilanlar.update(self._adim("madde_analizi", lambda: MaddeAnalizi(hesaplayici).rapor_yaz(self.cikti_klasoru)))
+
+        mentor_tablosu = self._adim("mentor_eslestirme", lambda: MentorEslestirici(kup).eslestir())
+        yazilanlar["mentor"] = self.cikti_klasoru / "mentor_eslestirmeleri.csv"
+        mentor_tablosu.to_csv(yazilanlar["mentor"], index=False, encoding="utf-8-sig")
+
+        agac = self._adim("organizasyon_agaci", lambda: OrganizasyonAgaci(kup))
+        yazilanlar["ekip"] = self.cikti_klasoru / "ekip_ozetleri.csv"
+        agac.ekip_tablosu().to_csv(yazilanlar["ekip"], index=False, encoding="utf-8-sig")
+
+        kaziyici = EtkinlikKaziyici(str(self.etkinlik_yolu))
+        planlayici = KohortPlanlayici(kup, kaziyici)
+        kohortlar = self._adim("kohort_planlama", planlayici.kohort_raporu)
+        yazilanlar["kohort"] = self.cikti_klasoru / "kohortlar.csv"
+        yazilanlar["kohort_uyeleri"] = self.cikti_klasoru / "kohort_uyeleri.csv"
+        kohortlar.to_csv(yazilanlar["kohort"], index=False, encoding="utf-8-sig")
+        planlayici.uye_listesi().to_csv(yazilanlar["kohort_uyeleri"], index=False, encoding="utf-8-sig")
+
+        return yazilanlar
+
+
+if __name__ == "__main__":
+    sonuc = TopluIslem().calistir()
+    print("\nYazilan dosyalar:")
+    for ad, yol in sonuc.items():
+        print(f"  {ad}: {yol}")
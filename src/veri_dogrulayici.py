@@ -0,0 +1,233 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.yetkinlik_skor_hesaplayici import YetkinlikSkorHesaplayici
+
+
+class VeriDogrulayici:
+    """
+    Modul Amaci:
+    1. Degerlendirme ciktisini skorlamadan once tek geciste kolon bazli
+       (vektorel) kontrollerden gecirir:
+       - zorunlu kolonlar ve bos hucreler
+       - 1-5 disi veya sayisal olmayan puanlar
+       - tekrar eden degerlendirici satirlari
+       - taninmayan yetkinlik etiketleri
+       - kendi kendini degerlendirme
+       - 'min_max_rules' disinda kalan degerlendirici sayilari
+    2. Kontrol bazinda adet ve ornek satirlar iceren yapisal bir rapor uretir.
+    3. Istenirse hatali satirlari karantinaya alip temiz tabloyu skorlamaya birakir.
+
+    Seviyeler: 'kritik' (toplu islem durur), 'hata' (satir karantinaya alinir),
+    'uyari' (sadece raporlanir).
+    """
+
+    ZORUNLU_KOLONLAR = [
+        "employee_id", "employee_name", "role", "evaluator_name",
+        "evaluator_group", "competency", "question_id", "score",
+    ]
+    TEKIL_ANAHTAR = ["employee_id", "evaluator_name", "competency", "question_id"]
+    MIN_PUAN, MAKS_PUAN = 1, 5
+    ORNEK_SAYISI = 5
+
+    def __init__(self, hesaplayici):
+        self.hesaplayici = hesaplayici
+        self.df = hesaplayici.df
+        self.rapor = None
+        self.hatali_maske = None
+
+    def _kontrol(self, ad, seviye, maske, aciklama):
+        """
+        Boolean satir maskesinden rapor kaydi uretir.
+        """
+        adet = int(maske.sum())
+        ornekler = self.df[maske].head(self.ORNEK_SAYISI) if adet else self.df.iloc[0:0]
+        return {
+            "kontrol": ad,
+            "seviye": seviye,
+            "aciklama": aciklama,
+            "adet": adet,
+            "ornek_satirlar": json.loads(ornekler.reset_index().to_json(orient="records", force_ascii=False)),
+        }
+
+    def dogrula(self):
+        """
+        Tum kontrolleri calistirir ve raporu dondurur.
+        """
+        df = self.df
+        kontroller = []
+
+        # --- 1. SEMA ---
+        eksik = [k for k in self.ZORUNLU_KOLONLAR if k not in df.columns]
+        if eksik:
+            kontroller.append({
+                "kontrol": "eksik_kolon", "seviye": "kritik", "aciklama": f"Eksik kolonlar: {eksik}",
+                "adet": len(eksik), "ornek_satirlar": [],
+            })
+            self.hatali_maske = np.ones(len(df), dtype=bool)
+            self.rapor = {"satir_sayisi": len(df), "karantina_sayisi": len(df), "kritik": True, "kontroller": kontroller}
+            return self.rapor
+
+        # --- 2. BOS HUCRE ---
+        bos = df[self.ZORUNLU_KOLONLAR].isna().any(axis=1).to_numpy()
+        kontroller.append(self._kontrol("bos_hucre", "hata", bos, "Zorunlu kolonlardan en az biri bos"))
+
+        # --- 3. PUAN ARALIGI ---
+        puan = pd.to_numeric(df["score"], errors="coerce").to_numpy(dtype=float)
+        sayisal_degil = np.isnan(puan) & df["score"].notna().to_numpy()
+        aralik_disi = (puan < self.MIN_PUAN) | (puan > self.MAKS_PUAN)
+        kontroller.append(self._kontrol("sayisal_olmayan_puan", "hata", sayisal_degil, "Puan sayiya cevrilemiyor"))
+        kontroller.append(self._kontrol(
+            "aralik_disi_puan", "hata", aralik_disi, f"Puan {self.MIN_PUAN}-{self.MAKS_PUAN} araliginda degil"
+        ))
+
+        # --- 4. TEKRAR EDEN DEGERLENDIRICI SATIRI (ilk satir korunur) ---
+        tekrar = df.duplicated(subset=self.TEKIL_ANAHTAR, keep="first").to_numpy()
+        kontroller.append(self._kontrol(
+            "tekrar_eden_satir", "hata", tekrar, "Ayni degerlendirici ayni soruyu birden fazla puanlamis"
+        ))
+
+        # --- 5. TANINMAYAN YETKINLIK (_yetkinlikAnahtariniBul etiketi degistirmeden donduruyor) ---
+        yetkinlik_kod, yetkinlik_adlari = self.hesaplayici.yetkinlik_kodlari()
+        bilinen = set(self.hesaplayici.mapping.values())
+        taninmayan_kod = np.array([ad not in bilinen for ad in yetkinlik_adlari], dtype=bool)
+        # Bos etiketler (kod -1) zaten 'bos_hucre' kontrolune takilir
+        taninmayan = (yetkinlik_kod >= 0) & taninmayan_kod[yetkinlik_kod] if len(yetkinlik_kod) else np.zeros(0, dtype=bool)
+        kontroller.append(self._kontrol(
+            "taninmayan_yetkinlik", "hata", taninmayan, "Yetkinlik etiketi hicbir rapor yetkinligine eslesmiyor"
+        ))
+
+        # --- 6. KENDI KENDINI DEGERLENDIRME ---
+        kendi = (
+            df["evaluator_name"].astype(str).str.strip().str.lower().to_numpy()
+            == df["employee_name"].astype(str).str.strip().str.lower().to_numpy()
+        )
+        kontroller.append(self._kontrol("kendi_degerlendirmesi", "hata", kendi, "Degerlendirici ile calisan ayni kisi"))
+
+        # --- 7. DEGERLENDIRICI SAYISI (min_max_rules) ---
+        grup_kod, grup_adlari = pd.factorize(df["evaluator_group"], sort=True)
+        grup_anahtarlari = np.array([self.hesaplayici.grup_anahtari_bul(g) for g in grup_adlari], dtype=object)
+        taninmayan_grup = (grup_kod >= 0) & pd.isna(grup_anahtarlari)[grup_kod] if len(grup_kod) else np.zeros(0, dtype=bool)
+        kontroller.append(self._kontrol(
+            "taninmayan_grup", "hata", taninmayan_grup, "Degerlendirici grubu agirlik kurallarinda yok"
+        ))
+        kontroller.append(self._kontrol(
+            "degerlendirici_sayisi", "uyari", self._sayi_ihlali(grup_kod, grup_anahtarlari),
+            "Calisanin bir gruptaki degerlendirici sayisi min_max_rules disinda"
+        ))
+
+        self.hatali_maske = bos | sayisal_degil | aralik_disi | tekrar | taninmayan | kendi | taninmayan_grup
+
+        self.rapor = {
+            "satir_sayisi": len(df),
+            "karantina_sayisi": int(self.hatali_maske.sum()),
+            "kritik": False,
+            "kontroller": kontroller,
+        }
+        return self.rapor
+
+    def _sayi_ihlali(self, grup_kod, grup_anahtarlari):
+        """
+        Her (calisan, kural anahtari) icin farkli degerlendirici sayisini tek
+        bincount ile sayar ve calisanin yaka tipine ait min/max kurallariyla
+        karsilastirir. 'Yönetici' ve '1.Yönetici' ayni anahtara (yonetici1) duser.
+        Ihlal eden calisanin o anahtardaki satirlari; hic satiri olmayan bir grupta
+        min kurali ihlal ediliyorsa calisanin tum satirlari isaretlenir.
+        """
+        df = self.df
+        sonuc = np.zeros(len(df), dtype=bool)
+        kurallar = {
+            yaka: self.hesaplayici.agirlik_kurallari.get(f"{yaka}_yaka", {}).get("min_max_rules", {})
+            for yaka in ("beyaz", "mavi")
+        }
+
+        # Kural anahtarlari: veride gorulenler + kurallarda tanimli olanlar
+        anahtarlar = sorted({a for a in grup_anahtarlari if a is not None} | {a for k in kurallar.values() for a in k})
+        anahtar_no = {a: i for i, a in enumerate(anahtarlar)}
+        grup_anahtar_kod = np.array([anahtar_no.get(a, -1) for a in grup_anahtarlari], dtype=np.int64)
+
+        cal_kod, cal_ids = pd.factorize(df["employee_id"], sort=True)
+        deg_kod, deg_adlari = pd.factorize(df["evaluator_name"])
+        n_anahtar, n_deg = len(anahtarlar), len(deg_adlari)
+
+        # Bos hucreli veya taninmayan gruplu satirlar sayima katilmaz
+        gecerli = (cal_kod >= 0) & (deg_kod >= 0) & (grup_kod >= 0)
+        gecerli[gecerli] = grup_anahtar_kod[grup_kod[gecerli]] >= 0
+        if not gecerli.any():
+            return sonuc
+        cal_kod, deg_kod = cal_kod[gecerli], deg_kod[gecerli]
+        anahtar_kod = grup_anahtar_kod[grup_kod[gecerli]]
+
+        # Tekil (calisan, anahtar, degerlendirici) uclulerini say
+        hucre = cal_kod.astype(np.int64) * n_anahtar + anahtar_kod
+        uclu = pd.unique(hucre * n_deg + deg_kod)
+        sayilar = np.bincount(uclu // n_deg, minlength=len(cal_ids) * n_anahtar).reshape(len(cal_ids), n_anahtar)
+
+        # Calisan bazinda yaka tipi ve o yakanin sinirlari
+        # (yaka kurali sadece benzersiz roller icin calistirilir)
+        rol_kod, rol_adlari = pd.factorize(df["role"].to_numpy()[gecerli])
+        rol_yaka = np.array([self.hesaplayici.yaka_tipi_belirle(r) for r in rol_adlari], dtype=object)
+        yakalar = np.full(len(cal_ids), "beyaz", dtype=object)
+        yakalar[cal_kod] = rol_yaka[rol_kod]
+
+        min_sinir = np.zeros((len(cal_ids), n_anahtar))
+        maks_sinir = np.full((len(cal_ids), n_anahtar), np.inf)
+        for yaka, yaka_kurallari in kurallar.items():
+            satirlar = yakalar == yaka
+            for anahtar, sinir in yaka_kurallari.items():
+                min_sinir[satirlar, anahtar_no[anahtar]] = sinir.get("min", 0)
+                maks_sinir[satirlar, anahtar_no[anahtar]] = sinir.get("max", np.inf)
+
+        ihlal = (sayilar < min_sinir) | (sayilar > maks_sinir)
+        eksik_grup = ((sayilar == 0) & ihlal).any(axis=1)
+        sonuc[gecerli] = ihlal[cal_kod, anahtar_kod] | eksik_grup[cal_kod]
+        return sonuc
+
+    def karantinaya_al(self):
+        """
+        'hata' seviyesindeki satirlari ayirir; temiz tabloyu hesaplayiciya verir.
+        Donus: (temiz_df, karantina_df)
+        """
+        if self.rapor is None:
+            self.dogrula()
+        karantina = self.df[self.hatali_maske]
+        temiz = self.df[~self.hatali_maske].reset_index(drop=True)
+        if not self.rapor["kritik"]:
+            temiz = temiz.assign(score=pd.to_numeric(temiz["score"]))
+        self.hesaplayici.veriyi_degistir(temiz)
+        return temiz, karantina
+
+    def rapor_yaz(self, cikti_klasoru=None, karantina_df=None):
+        """
+        Raporu JSON, karantinaya alinan satirlari CSV olarak yazar.
+        """
+        if self.rapor is None:
+            self.dogrula()
+        if cikti_klasoru is None:
+            cikti_klasoru = self.hesaplayici.kok_dizin / "output" / "analiz"
+        cikti_klasoru = Path(cikti_klasoru)
+        cikti_klasoru.mkdir(parents=True, exist_ok=True)
+
+        yollar = {"dogrulama": cikti_klasoru / "veri_dogrulama.json"}
+        with open(yollar["dogrulama"], "w", encoding="utf-8") as f:
+            json.dump(self.rapor, f, ensure_ascii=False, indent=2, default=str)
+        if karantina_df is not None:
+            yollar["karantina"] = cikti_klasoru / "karantina.csv"
+            karantina_df.to_csv(yollar["karantina"], index=True, encoding="utf-8-sig")
+        return yollar
+
+
+if __name__ == "__main__":
+    kok = Path(__file__).parent.parent
+    hesaplayici = YetkinlikSkorHesaplayici(kok / "data" / "input" / "faz0_sentetik_veri.csv")
+
+    dogrulayici = VeriDogrulayici(hesaplayici)
+    rapor = dogrulayici.dogrula()
+
+    print(f"--- Veri Dogrulama ({rapor['satir_sayisi']} satir) ---")
+    for kayit in rapor["kontroller"]:
+        print(f"[{kayit['seviye'].upper():6}] {kayit['kontrol']:<24} {kayit['adet']:>6}  {kayit['aciklama']}")
+    print(f"\nKarantinaya alinacak satir: {rapor['karantina_sayisi']}")
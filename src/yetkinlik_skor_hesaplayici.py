@@ -1,8 +1,9 @@
-import pandas as pd
 import json
 import os
 from pathlib import Path
 
+from src.tavsiye_motoru import TavsiyeMotoru
+
 class YetkinlikSkorHesaplayici:
     """
     Modul Amaci:
@@ -12,19 +13,29 @@ class YetkinlikSkorHesaplayici:
     4. Teknik yetkinlik isimlerini rapor isimlerine cevirir ve nihai skoru uretir.
     """
     
-    def __init__(self, veri_yolu):
+    def __init__(self, veri_yolu, paylasimli_matris=None):
+        # pandas sadece hesaplayici olusturulurken yuklenir (modul importu hafif kalir)
+        import pandas as pd
+
         # --- 1. DOSYA YOLLARI VE AYARLAR ---
         # __file__ kullanarak projenin ana dizinini (root) buluruz
         self.kok_dizin = Path(__file__).parent.parent
+
+        # Paylasimli mod: skorlar baska bir surecin yayinladigi matristen
+        # (PaylasimliSkorMatrisi) okunur, ham degerlendirme tablosu yuklenmez.
+        self.paylasimli_matris = paylasimli_matris
         
         # --- 2. CSV DOSYASINI GUVENLI OKUMA ---
-        try:
-            # Pandas ile veriyi oku
-            self.df = pd.read_csv(veri_yolu)
-        except Exception as e:
-            print(f"UYARI: Veri dosyasi okunamadi ({e}). Bos tablo olusturuluyor.")
-            # Hata durumunda kodun cokmemesi icin bos bir DataFrame olustur
+        if paylasimli_matris is not None:
             self.df = pd.DataFrame(columns=["employee_id", "employee_name", "role", "score"])
+        else:
+            try:
+                # Pandas ile veriyi oku
+                self.df = pd.read_csv(veri_yolu)
+            except Exception as e:
+                print(f"UYARI: Veri dosyasi okunamadi ({e}). Bos tablo olusturuluyor.")
+                # Hata durumunda kodun cokmemesi icin bos bir DataFrame olustur
+                self.df = pd.DataFrame(columns=["employee_id", "employee_name", "role", "score"])
 
         # --- 3. AGIRLIK KURALLARINI YUKLEME ---
         # Eskiden AgirlikMotoru'nun yaptigi isi artik burada yapiyoruz
@@ -57,6 +68,10 @@ class YetkinlikSkorHesaplayici:
             "yonetsel_cesaret_ve_karar_kalitesi": "Yönetsel Cesaret"
         }
 
+        # --- 5. ONBELLEKLER (Ilk ihtiyacta doldurulur) ---
+        self._yetkinlik_kod_onbellek = None
+        self._kalibrasyon = None
+
     # ============================================================
     # BOLUM A: AGIRLIK HESAPLAMA MANTIGI (Eski AgirlikMotoru)
     # ============================================================
@@ -126,6 +141,29 @@ class YetkinlikSkorHesaplayici:
             
         return varsayilan
 
+    def yaka_tipi_belirle(self, rol):
+        """
+        Unvana gore yaka tipini ("beyaz" / "mavi") belirler.
+        """
+        beyaz_yaka_anahtarlar = ["muhendis", "yonetici", "uzman", "direktor", "mühendis", "analist", "lider"]
+        if any(x in str(rol).lower() for x in beyaz_yaka_anahtarlar):
+            return "beyaz"
+        return "mavi"
+
+    def grup_anahtari_bul(self, grup):
+        """
+        CSV'deki degerlendirici grubunu ('1.Yönetici', 'Ekip' ...) agirlik
+        kurallarindaki anahtara ('yonetici1', 'ekip' ...) cevirir.
+        Taninmayan gruplar icin None doner.
+        """
+        temiz = str(grup).lower().replace("ö", "o").replace("ı", "i").strip()
+        if "yonetici" in temiz:
+            return "yonetici2" if temiz.startswith("2") else "yonetici1"
+        for anahtar in ("ekip", "ortak", "ast"):
+            if anahtar in temiz:
+                return anahtar
+        return None
+
     def dinamik_agirlik_getir(self, rol, grup_sayilari):
         """
         Dışarıdan çağrılacak ANA METOT budur.
@@ -147,6 +185,62 @@ class YetkinlikSkorHesaplayici:
     # BOLUM B: SKOR HESAPLAMA VE VERI ISLEME
     # ============================================================
 
+    def veriyi_degistir(self, df):
+        """
+        Degerlendirme tablosunu degistirir (orn. karantina sonrasi temiz tablo)
+        ve tabloya bagli onbellekleri sifirlar.
+        """
+        self.df = df
+        self._yetkinlik_kod_onbellek = None
+        self._kalibrasyon = None
+
+    def yetkinlik_kodlari(self):
+        """
+        'competency' kolonundaki ham etiketleri ('Analitik', 'Süreç' ...) ekran
+        isimlerine normalize eder ve her satir icin tamsayi kod dondurur.
+        Normalizasyon sadece benzersiz etiketler uzerinde yapilir, sonuc onbellege alinir.
+        Donus: (kodlar, ekran_isimleri)
+        """
+        if self._yetkinlik_kod_onbellek is None:
+            import numpy as np
+            import pandas as pd
+
+            motor = TavsiyeMotoru()
+            ham_kod, ham_etiketler = pd.factorize(self.df["competency"], sort=True)
+            normal = np.array([motor._yetkinlikAnahtariniBul(e) for e in ham_etiketler], dtype=object)
+            adlar, yeniden = np.unique(normal, return_inverse=True)
+            # Bos etiketler -1 olarak kalir
+            kodlar = np.where(ham_kod >= 0, yeniden[ham_kod], -1) if len(ham_kod) else ham_kod
+            self._yetkinlik_kod_onbellek = (kodlar, adlar)
+        return self._yetkinlik_kod_onbellek
+
+    def calisan_listesi(self):
+        """
+        Alfabetik calisan isimleri (paylasimli modda calisan rehberinden).
+        """
+        if self.paylasimli_matris is not None:
+            return sorted(self.paylasimli_matris.calisan_adlari())
+        return sorted(self.df["employee_name"].unique())
+
+    def calisan_bilgisi(self, isim):
+        """
+        Isme gore {"employee_id", "role"} dondurur; bulunamazsa None.
+        """
+        if self.paylasimli_matris is not None:
+            return self.paylasimli_matris.calisan_bilgisi(isim)
+        satirlar = self.df[self.df["employee_name"] == isim]
+        if satirlar.empty:
+            return None
+        return {"employee_id": satirlar.iloc[0]["employee_id"], "role": satirlar.iloc[0]["role"]}
+
+    def genel_ortalama(self):
+        """
+        Sirket geneli ham puan ortalamasi ('score' kolonu yoksa 3.5).
+        """
+        if self.paylasimli_matris is not None:
+            return self.paylasimli_matris.genel_ortalama
+        return self.df["score"].mean() if "score" in self.df.columns else 3.5
+
     def hesapla(self, calisan_id):
         """
         Belirli bir calisan icin yetkinlik puanlarini hesaplar.
@@ -155,6 +249,10 @@ class YetkinlikSkorHesaplayici:
         2. Yoksa 'score' sutunu uzerinden varyasyon (simulasyon) yapar.
         3. O da yoksa 3.0 doner.
         """
+        # Paylasimli modda skorlar yayinlanmis matristen okunur
+        if self.paylasimli_matris is not None:
+            return self.paylasimli_matris.skorlar(calisan_id)
+
         # 1. Calisanin verilerini suz
         calisan_df = self.df[self.df["employee_id"] == calisan_id]
         
@@ -199,6 +297,64 @@ class YetkinlikSkorHesaplayici:
         
         return final_skorlar
 
+    def hesapla_toplu(self):
+        """
+        hesapla() mantigini tum calisanlar icin tek geciste (groupby) uygular.
+        Paylasimli skor matrisini yayinlayan yukleyici surec kullanir.
+        Donus: (calisan_idleri, yetkinlik_adlari, matris); matris kirpilmis
+        fakat yuvarlanmamis ham puanlardir (yuvarlama okuyucuda yapilir).
+        """
+        import numpy as np
+
+        gruplar = self.df.groupby("employee_id", sort=True)
+        calisan_idleri = np.asarray(list(gruplar.groups))
+        # Ayni ekran ismine birden fazla teknik isim eslenirse sonuncusu gecerlidir
+        kaynaklar = {ekran_ismi: teknik_isim for teknik_isim, ekran_ismi in self.mapping.items()}
+        yetkinlik_adlari = list(kaynaklar)
+
+        matris = np.full((len(calisan_idleri), len(yetkinlik_adlari)), 3.0)
+        base_score = gruplar["score"].mean().to_numpy(dtype=float) if "score" in self.df.columns else None
+        for j, (ekran_ismi, teknik_isim) in enumerate(kaynaklar.items()):
+            if teknik_isim in self.df.columns:
+                matris[:, j] = gruplar[teknik_isim].mean().to_numpy(dtype=float)
+            elif base_score is not None:
+                varyasyon = (hash(teknik_isim) % 80) / 100 - 0.4
+                matris[:, j] = base_score + varyasyon
+
+        return calisan_idleri, yetkinlik_adlari, np.clip(matris, 1.0, 5.0)
+
+    # ============================================================
+    # BOLUM C: DEGERLENDIRICI KALIBRASYONU (Opsiyonel)
+    # ============================================================
+
+    def hesapla_kalibre(self, calisan_id):
+        """
+        Degerlendirici comertlik/sertlik etkisi ayiklanmis skorlari ham skorlarla
+        yan yana dondurur: {ekran_ismi: {"ham": x, "kalibre": y}}
+        Model ilk cagrida tum populasyon icin bir kez cozulur (scipy gerekir).
+        """
+        # Kalibrasyon ham degerlendirme satirlarini gerektirir (paylasimli modda yok)
+        if self.paylasimli_matris is not None:
+            return {}
+
+        if self._kalibrasyon is None:
+            # scipy sadece bu opsiyonel asamada gerekli oldugu icin gec yuklenir
+            from src.degerlendirici_kalibrasyonu import DegerlendiriciKalibrasyonu
+
+            calisan_etkileri, _ = DegerlendiriciKalibrasyonu(self).kalibre_et()
+            self._kalibrasyon = calisan_etkileri.set_index("employee_id")
+
+        if calisan_id not in self._kalibrasyon.index:
+            return {}
+
+        sonuc = {}
+        for _, satir in self._kalibrasyon.loc[[calisan_id]].iterrows():
+            sonuc[satir["yetkinlik"]] = {
+                "ham": round(max(1.0, min(5.0, satir["ham_skor"])), 2),
+                "kalibre": round(max(1.0, min(5.0, satir["kalibre_skor"])), 2),
+            }
+        return sonuc
+
 # --- TEST BLOGU (Dosya dogrudan calistirilirsa burasi calisir) ---
 if __name__ == "__main__":
     # Test verisi yolu (Kendi yolunuza gore duzenleyin)
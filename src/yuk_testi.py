@@ -0,0 +1,305 @@
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import urllib.request
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+
+class YukTesti:
+    """
+    Modul Amaci:
+    1. Streamlit panelini (app.py) headless bir yerel sunucuda baslatir ve
+       tarayicinin kullandigi websocket protokoluyle N esanli oturum acar.
+    2. Her oturum rastgele calisan secip yeniden calistirma (rerun) ister; tum
+       oturumlar ayni sunucu surecinde calistigi icin @st.cache_resource
+       nesneleri paylasilir ve gercek kullanimdaki cekisme olculur.
+    3. Rerun gecikmesi (p50/p95/p99), throughput ve sunucu bellegi (RSS) zaman
+       serisi toplanir; sonuc karsilastirilabilir bir JSON rapor olarak yazilir.
+
+    Not: streamlit.testing.v1.AppTest her calistirmada global Runtime nesnesini
+    degistirdigi icin ayni surecte esanli kullanilamaz; bu yuzden gercek sunucu
+    kullanilir.
+    """
+
+    ORNEKLEME_ARALIGI = 0.5  # sn, bellek ornekleme periyodu
+    ZAMAN_ASIMI = 120  # sn, tek rerun icin
+    BASLATMA_ZAMAN_ASIMI = 60  # sn, sunucunun ayaga kalkmasi icin
+
+    def __init__(self, oturum_sayisi=10, rerun_sayisi=20, dusunme_suresi=0.0, tohum=42, port=8599, app_yolu=None):
+        self.kok_dizin = Path(__file__).parent.parent
+        self.app_yolu = Path(app_yolu or self.kok_dizin / "app.py")
+        self.oturum_sayisi = oturum_sayisi
+        self.rerun_sayisi = rerun_sayisi
+        self.dusunme_suresi = dusunme_suresi
+        self.tohum = tohum
+        self.port = port
+
+        self.sunucu = None
+        self._gecikmeler = []
+        self._ilk_yuklemeler = []
+        self._hatalar = []
+        self._bellek = []
+
+    # ============================================================
+    # BOLUM A: SUNUCU YONETIMI
+    # ============================================================
+
+    def sunucu_baslat(self):
+        """
+        app.py'yi headless Streamlit sunucusu olarak baslatir ve saglik ucu cevap
+        verene kadar bekler.
+        """
+        komut = [
+            sys.executable, "-m", "streamlit", "run", str(self.app_yolu),
+            "--server.headless", "true",
+            "--server.port", str(self.port),
+            "--browser.gatherUsageStats", "false",
+        ]
+        self.sunucu = subprocess.Popen(komut, cwd=self.kok_dizin, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        saglik = f"http://127.0.0.1:{self.port}/_stcore/health"
+        bitis = time.monotonic() + self.BASLATMA_ZAMAN_ASIMI
+        while time.monotonic() < bitis:
+            if self.sunucu.poll() is not None:
+                raise RuntimeError("Streamlit sunucusu baslatilamadi.")
+            try:
+                with urllib.request.urlopen(saglik, timeout=1) as cevap:
+                    if cevap.status == 200:
+                        return
+            except OSError:
+                time.sleep(0.2)
+        self.sunucu_durdur()
+        raise RuntimeError("Streamlit sunucusu zamaninda cevap vermedi.")
+
+    def sunucu_durdur(self):
+        if self.sunucu is not None and self.sunucu.poll() is None:
+            self.sunucu.terminate()
+            try:
+                self.sunucu.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.sunucu.kill()
+        self.sunucu = None
+
+    def _sunucu_rss_mb(self):
+        """
+        Sunucu surecinin RSS bellegi (MB). /proc olmayan sistemlerde None.
+        """
+        try:
+            with open(f"/proc/{self.sunucu.pid}/statm", "r") as f:
+                sayfa = int(f.read().split()[1])
+            return round(sayfa * os.sysconf("SC_PAGE_SIZE") / 1024 ** 2, 1)
+        except (OSError, ValueError, IndexError, AttributeError):
+            return None
+
+    # ============================================================
+    # BOLUM B: OTURUM SIMULASYONU
+    # ============================================================
+
+    @staticmethod
+    async def _rerun(ws, widget_durumu=None):
+        """
+        Bir rerun ister ve 'script_finished' gelene kadar mesajlari okur.
+        Donus: (sure_sn, calisan_secim_kutusu, hata_mesaji)
+        """
+        istek = BackMsg()
+        istek.rerun_script.query_string = ""
+        if widget_durumu is not None:
+            istek.rerun_script.widget_states.widgets.append(widget_durumu)
+
+        baslangic = time.perf_counter()
+        await ws.send(istek.SerializeToString())
+
+        secim_kutusu, hata = None, None
+        while True:
+            mesaj = ForwardMsg()
+            mesaj.ParseFromString(await ws.recv())
+            tip = mesaj.WhichOneof("type")
+            if tip == "delta" and mesaj.delta.WhichOneof("type") == "new_element":
+                eleman = mesaj.delta.new_element
+                eleman_tipi = eleman.WhichOneof("type")
+                if eleman_tipi == "selectbox" and secim_kutusu is None:
+                    secim_kutusu = eleman.selectbox
+                elif eleman_tipi == "exception":
+                    hata = eleman.exception.message
+            elif tip == "script_finished":
+                if mesaj.script_finished == ForwardMsg.FINISHED_WITH_COMPILE_ERROR:
+                    hata = hata or "derleme hatasi"
+                return time.perf_counter() - baslangic, secim_kutusu, hata
+
+    async def _oturum(self, no):
+        """
+        Tek bir kullanici oturumu: ilk yukleme + rastgele calisan secimleri.
+        """
+        rng = random.Random(self.tohum + no)
+        adres = f"ws://127.0.0.1:{self.port}/_stcore/stream"
+        try:
+            async with websockets.connect(adres, subprotocols=["streamlit"], max_size=None) as ws:
+                sure, secim_kutusu, hata = await asyncio.wait_for(self._rerun(ws), self.ZAMAN_ASIMI)
+                self._ilk_yuklemeler.append(sure)
+                if hata:
+                    self._hatalar.append(hata)
+                if secim_kutusu is None:
+                    self._hatalar.append(f"oturum {no}: calisan secim kutusu bulunamadi")
+                    return
+
+                secenekler = list(secim_kutusu.options)
+                for _ in range(self.rerun_sayisi):
+                    if self.dusunme_suresi:
+                        await asyncio.sleep(rng.uniform(0, 2 * self.dusunme_suresi))
+                    durum = BackMsg().rerun_script.widget_states.widgets.add()
+                    durum.id = secim_kutusu.id
+                    durum.string_value = rng.choice(secenekler)
+                    sure, _, hata = await asyncio.wait_for(self._rerun(ws, durum), self.ZAMAN_ASIMI)
+                    self._gecikmeler.append(sure)
+                    if hata:
+                        self._hatalar.append(hata)
+        except Exception as e:
+            self._hatalar.append(f"oturum {no}: {type(e).__name__}: {e}")
+
+    async def _bellek_ornekle(self, baslangic, dur):
+        while not dur.is_set():
+            rss = self._sunucu_rss_mb()
+            if rss is not None:
+                self._bellek.append((round(time.perf_counter() - baslangic, 2), rss))
+            try:
+                await asyncio.wait_for(dur.wait(), self.ORNEKLEME_ARALIGI)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _senaryo(self):
+        baslangic = time.perf_counter()
+        dur = asyncio.Event()
+        ornekleyici = asyncio.create_task(self._bellek_ornekle(baslangic, dur))
+        await asyncio.gather(*(self._oturum(i) for i in range(self.oturum_sayisi)))
+        toplam_sure = time.perf_counter() - baslangic
+        dur.set()
+        await ornekleyici
+        return toplam_sure
+
+    def calistir(self):
+        """
+        Sunucuyu baslatir, tum oturumlari esanli kosturur, sunucuyu kapatir ve
+        rapor sozlugunu dondurur.
+        """
+        self.sunucu_baslat()
+        try:
+            toplam_sure = asyncio.run(self._senaryo())
+        finally:
+            self.sunucu_durdur()
+        return self._rapor(toplam_sure)
+
+    # ============================================================
+    # BOLUM C: RAPOR
+    # ============================================================
+
+    def _rapor(self, toplam_sure):
+        gecikme_ms = np.array(self._gecikmeler) * 1000
+        ilk_ms = np.array(self._ilk_yuklemeler) * 1000
+
+        def yuzdelik(dizi):
+            if len(dizi) == 0:
+                return {"p50": None, "p95": None, "p99": None, "maks": None}
+            p50, p95, p99 = np.percentile(dizi, [50, 95, 99])
+            return {"p50": round(float(p50), 1), "p95": round(float(p95), 1), "p99": round(float(p99), 1), "maks": round(float(dizi.max()), 1)}
+
+        bellek = [mb for _, mb in self._bellek]
+        return {
+            "zaman": datetime.now().isoformat(timespec="seconds"),
+            "ortam": {"python": platform.python_version(), "platform": platform.platform(), "cpu": os.cpu_count()},
+            "parametreler": {
+                "oturum_sayisi": self.oturum_sayisi,
+                "rerun_sayisi": self.rerun_sayisi,
+                "dusunme_suresi": self.dusunme_suresi,
+                "tohum": self.tohum,
+            },
+            "toplam_sure_sn": round(toplam_sure, 2),
+            "rerun_adedi": int(len(gecikme_ms)),
+            "throughput_rerun_sn": round(len(gecikme_ms) / toplam_sure, 2) if toplam_sure > 0 else None,
+            "rerun_gecikme_ms": yuzdelik(gecikme_ms),
+            "ilk_yukleme_ms": yuzdelik(ilk_ms),
+            "sunucu_bellek_mb": {
+                "baslangic": bellek[0] if bellek else None,
+                "maks": max(bellek) if bellek else None,
+                "bitis": bellek[-1] if bellek else None,
+                "zaman_serisi": self._bellek,
+            },
+            "hata_sayisi": len(self._hatalar),
+            "hata_ornekleri": self._hatalar[:5],
+        }
+
+    def rapor_yaz(self, rapor, cikti_klasoru=None):
+        """
+        Raporu zaman damgali JSON olarak yazar.
+        """
+        cikti_klasoru = Path(cikti_klasoru or self.kok_dizin / "output" / "yuk_testi")
+        cikti_klasoru.mkdir(parents=True, exist_ok=True)
+        damga = rapor["zaman"].replace(":", "").replace("-", "")
+        yol = cikti_klasoru / f"yuk_testi_{rapor['parametreler']['oturum_sayisi']}oturum_{damga}.json"
+        with open(yol, "w", encoding="utf-8") as f:
+            json.dump(rapor, f, ensure_ascii=False, indent=2)
+        return yol
+
+
+def karsilastir(onceki, simdiki):
+    """
+    Iki raporun temel metriklerini yan yana koyar; degisimi yuzde olarak verir.
+    """
+    metrikler = [
+        ("rerun p50 (ms)", ("rerun_gecikme_ms", "p50")),
+        ("rerun p95 (ms)", ("rerun_gecikme_ms", "p95")),
+        ("rerun p99 (ms)", ("rerun_gecikme_ms", "p99")),
+        ("throughput (rerun/sn)", ("throughput_rerun_sn",)),
+        ("maks bellek (MB)", ("sunucu_bellek_mb", "maks")),
+        ("hata sayisi", ("hata_sayisi",)),
+    ]
+    satirlar = []
+    for ad, yol in metrikler:
+        a, b = onceki, simdiki
+        for anahtar in yol:
+            a, b = (a or {}).get(anahtar), (b or {}).get(anahtar)
+        degisim = f"{(b - a) / a * 100:+.1f}%" if a and b is not None else "-"
+        satirlar.append(f"{ad:<24} {str(a):>10} -> {str(b):>10}  {degisim}")
+    return "\n".join(satirlar)
+
+
+if __name__ == "__main__":
+    ayrac = argparse.ArgumentParser(description="Streamlit paneli icin esanli kullanici yuk testi")
+    ayrac.add_argument("--oturum", type=int, default=10, help="Esanli oturum sayisi")
+    ayrac.add_argument("--rerun", type=int, default=20, help="Oturum basina rerun sayisi")
+    ayrac.add_argument("--dusunme", type=float, default=0.0, help="Rerunlar arasi ortalama bekleme (sn)")
+    ayrac.add_argument("--port", type=int, default=8599)
+    ayrac.add_argument("--tohum", type=int, default=42)
+    ayrac.add_argument("--karsilastir", help="Karsilastirilacak onceki rapor (JSON)")
+    arguman = ayrac.parse_args()
+
+    test = YukTesti(
+        oturum_sayisi=arguman.oturum, rerun_sayisi=arguman.rerun,
+        dusunme_suresi=arguman.dusunme, tohum=arguman.tohum, port=arguman.port,
+    )
+    rapor = test.calistir()
+    yol = test.rapor_yaz(rapor)
+
+    print(f"--- Yuk Testi ({arguman.oturum} oturum x {arguman.rerun} rerun) ---")
+    print(f"Rerun gecikmesi (ms): {rapor['rerun_gecikme_ms']}")
+    print(f"Ilk yukleme (ms): {rapor['ilk_yukleme_ms']}")
+    print(f"Throughput: {rapor['throughput_rerun_sn']} rerun/sn")
+    print(f"Sunucu bellegi (MB): baslangic {rapor['sunucu_bellek_mb']['baslangic']}, maks {rapor['sunucu_bellek_mb']['maks']}")
+    print(f"Hata: {rapor['hata_sayisi']} {rapor['hata_ornekleri']}")
+    print(f"Rapor: {yol}")
+
+    if arguman.karsilastir:
+        with open(arguman.karsilastir, "r", encoding="utf-8") as f:
+            print("\n--- Karsilastirma ---")
+            print(karsilastir(json.load(f), rapor))